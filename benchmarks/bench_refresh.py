@@ -0,0 +1,327 @@
+"""Measure the cost of PMG coordinator refreshes against a local mock server.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.bench_refresh --nodes 3 --cycles 50 --latency 0.02
+
+The mock server runs in its own thread and event loop, so CPU time is
+measured for the Home Assistant loop thread only. Allocation peaks are
+process wide and include the mock server.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any
+
+import aiohttp
+from homeassistant import config_entries
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_PORT,
+    CONF_USERNAME,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.pmg import PMGDataUpdateCoordinator, sensor
+from custom_components.pmg.api import PMGApiClient, PMGEndpoint
+from custom_components.pmg.const import (
+    CACHE_TTL,
+    CONF_MAX_CONCURRENCY,
+    CONF_REALM,
+    CONF_STATS_DAYS,
+    DOMAIN,
+    TIER_SECTIONS,
+)
+from custom_components.pmg.storage import PMGStorage
+
+from .mock_pmg import MockPMG, MockPMGConfig
+
+INTEGRATION_FILES = "*/custom_components/pmg/*"
+
+
+class _PlainHTTPEndpoint(PMGEndpoint):
+    """The mock server speaks plain HTTP; everything else is the real client."""
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/api2/json"
+
+
+@dataclass
+class _BenchEntry:
+    """Just the parts of a ConfigEntry the coordinator and sensors read."""
+
+    entry_id: str
+    data: dict[str, Any]
+    options: dict[str, Any]
+    title: str = "PMG benchmark"
+    domain: str = DOMAIN
+
+
+@dataclass
+class CycleResult:
+    wall_ms: float
+    cpu_ms: float
+    requests: int
+    errors: int
+    logins: int
+    bytes: int
+    state_writes: int
+    alloc_peak_kib: float
+    retained_kib: float
+    success: bool
+
+
+class _MockServerThread:
+    """Run MockPMG on a private event loop in a daemon thread."""
+
+    def __init__(self, config: MockPMGConfig) -> None:
+        self.server = MockPMG(config)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="mock-pmg", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.async_start(), self._loop).result()
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.server.async_stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def _integration_bytes() -> int:
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(True, INTEGRATION_FILES)]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+async def _async_setup_hass(config_dir: str) -> HomeAssistant:
+    hass = HomeAssistant(config_dir)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    return hass
+
+
+async def async_run(args: argparse.Namespace) -> list[CycleResult]:
+    mock = _MockServerThread(
+        MockPMGConfig(
+            nodes=args.nodes,
+            stats_rows=args.stats_rows,
+            packages=args.packages,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+    )
+    mock.start()
+    counters = mock.server.counters
+    tiers = [tier.strip() for tier in args.tiers.split(",") if tier.strip()]
+    unknown = set(tiers) - set(TIER_SECTIONS)
+    if unknown:
+        raise SystemExit(f"Unknown tiers: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await _async_setup_hass(config_dir)
+        entry = _BenchEntry(
+            entry_id="benchmark",
+            data={
+                CONF_HOST: "127.0.0.1",
+                CONF_PORT: mock.server.port,
+                CONF_USERNAME: "bench",
+                CONF_PASSWORD: "bench",
+                CONF_REALM: "pmg",
+            },
+            options={
+                CONF_STATS_DAYS: args.stats_days,
+                CONF_MAX_CONCURRENCY: args.max_concurrency,
+            },
+        )
+        session = aiohttp.ClientSession()
+        client = PMGApiClient(
+            session=session,
+            host="127.0.0.1",
+            port=mock.server.port,
+            username="bench",
+            password="bench",
+            realm="pmg",
+            verify_ssl=False,
+            cache_ttl=CACHE_TTL,
+            ssl_param=False,
+        )
+        client.endpoints[:] = [_PlainHTTPEndpoint("127.0.0.1", mock.server.port)]
+        storage = PMGStorage(hass, entry.entry_id)
+        coordinator = PMGDataUpdateCoordinator(hass, client, entry, storage)
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+        state_writes = 0
+
+        def _count_write(event: Any) -> None:
+            nonlocal state_writes
+            state_writes += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _count_write)
+
+        results: list[CycleResult] = []
+        tracemalloc.start()
+        try:
+            for cycle in range(args.cycles + 1):
+                if cycle:
+                    # Pretend the selected tiers are due again.
+                    for tier in tiers:
+                        coordinator._tier_refreshed.pop(tier, None)
+                counters.reset()
+                state_writes = 0
+                retained_before = _integration_bytes()
+                tracemalloc.reset_peak()
+                cpu_started = time.thread_time()
+                started = time.perf_counter()
+
+                await coordinator.async_refresh()
+                if cycle == 0:
+                    # Entities are created from the first refresh, as in setup.
+                    platform = EntityPlatform(
+                        hass=hass,
+                        logger=logging.getLogger(__name__),
+                        domain="sensor",
+                        platform_name=DOMAIN,
+                        platform=None,
+                        scan_interval=timedelta(seconds=0),
+                        entity_namespace=None,
+                    )
+                    await sensor.async_setup_entry(
+                        hass, entry, platform.async_add_entities
+                    )
+                await hass.async_block_till_done()
+
+                wall = time.perf_counter() - started
+                cpu = time.thread_time() - cpu_started
+                _, peak = tracemalloc.get_traced_memory()
+                results.append(
+                    CycleResult(
+                        wall_ms=wall * 1000,
+                        cpu_ms=cpu * 1000,
+                        requests=counters.total_requests,
+                        errors=counters.errors,
+                        logins=counters.logins,
+                        bytes=counters.bytes_sent,
+                        state_writes=state_writes,
+                        alloc_peak_kib=peak / 1024,
+                        retained_kib=(_integration_bytes() - retained_before) / 1024,
+                        success=coordinator.last_update_success,
+                    )
+                )
+                if args.verbose:
+                    print(f"cycle {cycle:>4}: {_format(results[-1])}")
+        finally:
+            tracemalloc.stop()
+            await coordinator.async_shutdown()
+            await session.close()
+            await hass.async_stop(force=True)
+            mock.stop()
+
+    return results
+
+
+def _format(result: CycleResult) -> str:
+    return (
+        f"{result.wall_ms:8.2f} ms wall  {result.cpu_ms:7.2f} ms cpu  "
+        f"{result.requests:4} req  {result.bytes:8} B  "
+        f"{result.state_writes:4} writes  {result.alloc_peak_kib:8.1f} KiB peak"
+    )
+
+
+def _summary(results: list[CycleResult]) -> dict[str, dict[str, float]]:
+    summary: dict[str, dict[str, float]] = {}
+    for name in (
+        "wall_ms",
+        "cpu_ms",
+        "requests",
+        "bytes",
+        "state_writes",
+        "alloc_peak_kib",
+        "retained_kib",
+    ):
+        values = sorted(getattr(result, name) for result in results)
+        summary[name] = {
+            "median": statistics.median(values),
+            "p95": values[min(len(values) - 1, round(len(values) * 0.95))],
+            "max": values[-1],
+        }
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1)
+    parser.add_argument("--stats-rows", type=int, default=1)
+    parser.add_argument("--stats-days", type=int, default=7)
+    parser.add_argument("--packages", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500 replies")
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument(
+        "--tiers",
+        default=",".join(TIER_SECTIONS),
+        help="tiers forced due on every cycle after the first",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="write all cycle results here")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(async_run(args))
+    first, steady = results[0], results[1:]
+
+    print(f"first refresh: {_format(first)}")
+    summary = _summary(steady) if steady else {}
+    for name, values in summary.items():
+        print(
+            f"{name:>15}: median {values['median']:10.2f}  "
+            f"p95 {values['p95']:10.2f}  max {values['max']:10.2f}"
+        )
+    failed = sum(not result.success for result in steady)
+    if failed:
+        print(f"{failed} of {len(steady)} refreshes failed")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "args": {key: str(value) for key, value in vars(args).items()},
+                    "first": asdict(first),
+                    "cycles": [asdict(result) for result in steady],
+                    "summary": summary,
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
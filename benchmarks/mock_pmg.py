@@ -0,0 +1,208 @@
+"""Local stand-in for the PMG /api2/json endpoints used by PMGApiClient."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+import asyncio
+import random
+import time
+
+from aiohttp import web
+
+COOKIE_NAME = "PMGAuthCookie"
+TICKET = "PMG:bench@pmg::benchmark"
+
+
+@dataclass
+class MockPMGConfig:
+    nodes: int = 1
+    stats_rows: int = 1
+    packages: int = 20
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class MockPMGCounters:
+    requests: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+    logins: int = 0
+    bytes_sent: int = 0
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def reset(self) -> None:
+        self.requests.clear()
+        self.errors = 0
+        self.logins = 0
+        self.bytes_sent = 0
+
+
+class MockPMG:
+    """aiohttp application serving synthetic PMG responses.
+
+    Request paths are counted with node names replaced by {node}, response
+    bodies are counted in bytes_sent.
+    """
+
+    def __init__(self, config: MockPMGConfig) -> None:
+        self.config = config
+        self.counters = MockPMGCounters()
+        self._random = random.Random(config.seed)
+        self._node_names = [f"pmg{index}" for index in range(1, config.nodes + 1)]
+        self._runner: web.AppRunner | None = None
+        self.port = 0
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_post("/api2/json/access/ticket", self._ticket)
+        self.app.router.add_get("/api2/json/version", self._version)
+        self.app.router.add_get("/api2/json/nodes", self._nodes)
+        self.app.router.add_get("/api2/json/config/cluster/status", self._cluster_status)
+        self.app.router.add_get("/api2/json/nodes/{node}/status", self._status)
+        self.app.router.add_get("/api2/json/nodes/{node}/apt/update", self._apt_update)
+        self.app.router.add_get("/api2/json/statistics/mail", self._mail_stats)
+        self.app.router.add_get("/api2/json/quarantine/spamstatus", self._spam_status)
+        self.app.router.add_get("/api2/json/quarantine/virusstatus", self._virus_status)
+
+    async def async_start(self) -> None:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def async_stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: web.RequestHandler
+    ) -> web.StreamResponse:
+        node = request.match_info.get("node")
+        path = request.path.removeprefix("/api2/json")
+        if node:
+            path = path.replace(f"/{node}/", "/{node}/")
+        self.counters.requests[path] += 1
+
+        delay = self.config.latency + self._random.uniform(0, self.config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if request.method == "GET":
+            if request.cookies.get(COOKIE_NAME) != TICKET:
+                return self._count(web.json_response({"data": None}, status=401))
+            if node is not None and node not in self._node_names:
+                return self._count(web.json_response({"data": None}, status=404))
+            if self._random.random() < self.config.error_rate:
+                self.counters.errors += 1
+                return self._count(
+                    web.json_response({"data": None, "errors": "injected"}, status=500)
+                )
+        return self._count(await handler(request))
+
+    def _count(self, response: web.StreamResponse) -> web.StreamResponse:
+        if isinstance(response, web.Response) and response.body is not None:
+            self.counters.bytes_sent += len(response.body)
+        return response
+
+    async def _ticket(self, request: web.Request) -> web.Response:
+        self.counters.logins += 1
+        return web.json_response(
+            {"data": {"ticket": TICKET, "CSRFPreventionToken": "bench:csrf"}}
+        )
+
+    async def _version(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"data": {"version": "8.1", "release": "8.1", "repoid": "benchmark"}}
+        )
+
+    async def _nodes(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"data": [{"node": name, "status": "online"} for name in self._node_names]}
+        )
+
+    async def _cluster_status(self, request: web.Request) -> web.Response:
+        # A standalone node; cluster members would point the client elsewhere.
+        return web.json_response({"data": []})
+
+    async def _status(self, request: web.Request) -> web.Response:
+        rand = self._random
+        return web.json_response(
+            {
+                "data": {
+                    "cpu": rand.random(),
+                    "cpuinfo": {"cpus": 4, "model": "Benchmark CPU", "sockets": 1},
+                    "loadavg": [f"{rand.uniform(0, 4):.2f}" for _ in range(3)],
+                    "memory": {"used": rand.randrange(1 << 30, 4 << 30), "total": 4 << 30},
+                    "rootfs": {"used": rand.randrange(1 << 33, 1 << 34), "total": 1 << 35},
+                    "swap": {"used": 0, "total": 1 << 30},
+                    "uptime": int(time.monotonic()),
+                    "kversion": "Linux 6.8.12-benchmark",
+                    "pmgversion": "8.1",
+                }
+            }
+        )
+
+    async def _apt_update(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "data": [
+                    {
+                        "Package": f"package-{index}",
+                        "Title": f"Benchmark package {index}",
+                        "Description": "Synthetic package description. " * 8,
+                        "OldVersion": "1.0.0",
+                        "Version": "1.0.1",
+                        "Origin": "Proxmox",
+                        "Priority": "optional",
+                        "Section": "admin",
+                        "ChangeLogUrl": f"https://example.invalid/{index}/changelog",
+                    }
+                    for index in range(self.config.packages)
+                ]
+            }
+        )
+
+    async def _mail_stats(self, request: web.Request) -> web.Response:
+        rows = [self._stats_row() for _ in range(self.config.stats_rows)]
+        return web.json_response({"data": rows[0] if len(rows) == 1 else rows})
+
+    def _stats_row(self) -> dict[str, float]:
+        rand = self._random
+        count_in = rand.randrange(100, 1000)
+        count_out = rand.randrange(10, 200)
+        return {
+            "count": count_in + count_out,
+            "count_in": count_in,
+            "count_out": count_out,
+            "bytes_in": count_in * 20000,
+            "bytes_out": count_out * 15000,
+            "spamcount_in": rand.randrange(0, count_in // 4),
+            "spamcount_out": 0,
+            "viruscount_in": rand.randrange(0, 5),
+            "viruscount_out": 0,
+            "bounces_in": rand.randrange(0, 10),
+            "bounces_out": rand.randrange(0, 10),
+            "junk_in": rand.randrange(0, 50),
+            "pregreet_rejects": rand.randrange(0, 20),
+            "rbl_rejects": rand.randrange(0, 50),
+            "glcount": rand.randrange(0, 5),
+            "spfcount": rand.randrange(0, 5),
+            "avptime": rand.uniform(0.1, 3.0),
+        }
+
+    async def _spam_status(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"data": {"count": self._random.randrange(0, 500), "avgbytes": 12000, "mbytes": 4.2}}
+        )
+
+    async def _virus_status(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"data": {"count": self._random.randrange(0, 5), "avgbytes": 40000, "mbytes": 0.1}}
+        )
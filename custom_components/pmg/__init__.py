@@ -2,31 +2,133 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from functools import partial
 import logging
+import ssl
+import time
+from typing import Any, Awaitable, Callable
+
+import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .api import PMGApiClient, PMGApiError
+from .api import (
+    UNSUPPORTED_STATUSES,
+    PMGApiClient,
+    PMGApiError,
+    PMGCapabilityCache,
+    build_ssl_param,
+)
+from .backfill import async_setup_services, async_unload_services
+from .cluster import (
+    SHARED_TTL_FACTOR,
+    PMGClusterHub,
+    async_acquire_hub,
+    async_cluster_key,
+    async_release_hub,
+)
 from .const import (
+    CACHE_TTL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_CA_CERT,
+    CONF_DEDICATED_POOL,
+    CONF_FAST_STARTUP,
+    CONF_MAIL_SCAN_INTERVAL,
+    CONF_MAILCOUNT_TIMESPAN,
+    CONF_MAX_CONCURRENCY,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MESSAGE_TRACKER,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
     CONF_REALM,
     CONF_SCAN_INTERVAL,
+    CONF_SSL_FINGERPRINT,
     CONF_STATS_DAYS,
+    CONF_STATS_WINDOWS,
+    CONF_SYSLOG_PORT,
+    CONF_SYSTEM_SCAN_INTERVAL,
     CONF_VERIFY_SSL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DEDICATED_POOL,
+    DEFAULT_FAST_STARTUP,
+    DEFAULT_MAIL_SCAN_INTERVAL,
+    DEFAULT_MAILCOUNT_TIMESPAN,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MESSAGE_TRACKER,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_STATS_DAYS,
+    DEFAULT_STATS_WINDOWS,
+    DEFAULT_SYSLOG_PORT,
+    DEFAULT_SYSTEM_SCAN_INTERVAL,
     DEFAULT_VERIFY_SSL,
+    CLUSTER,
     DOMAIN,
+    DOMAIN_MAX_REFRESHES,
+    ENDPOINT_APT_UPDATE,
+    ENDPOINT_CLUSTER_STATUS,
+    ENDPOINT_TRACKER,
+    LIVE_UPDATE_DELAY,
+    MAIL_RATE_WINDOWS,
+    POOL_DNS_CACHE_TTL,
+    POOL_KEEPALIVE_TIMEOUT,
+    REQUEST_WEIGHTS,
+    SECTION_MAILCOUNT,
+    SECTION_NODES,
+    SECTION_QUARANTINE,
+    SECTION_STATS,
+    SECTION_TIERS,
+    SECTION_TIMEOUTS,
+    SECTION_TRACKER,
+    SECTION_UPDATES,
+    SECTION_VERSION,
+    SECTION_WAIT,
+    TIER_MAIL,
+    TIER_NODES,
+    TIER_SECTIONS,
+    TIER_SYSTEM,
+)
+from .model import (
+    PMGSnapshot,
+    project_data,
+    project_quarantine,
+    project_status,
+    project_updates,
+    project_version,
 )
+from .scheduler import PMGAdaptiveInterval, PMGBackoff, PMGDomainScheduler
+from .stats import (
+    DAY,
+    PMGLiveStats,
+    PMGMailCountSeries,
+    PMGMailStatsCache,
+    flatten_stats,
+    parse_windows,
+    split_window,
+)
+from .storage import DATA_STORAGE, PMGStorage, async_get_storage
+from .syslog import PMGSyslogServer, async_resolve_sources, async_subscribe_syslog
+from .tracker import PMGTracker
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     registry = er.async_get(hass)
@@ -38,7 +140,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         ):
             registry.async_remove(reg_entry.entity_id)
 
-    session = async_get_clientsession(hass)
+    verify_ssl = entry.options.get(
+        CONF_VERIFY_SSL,
+        entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+    )
+    try:
+        ssl_param = await hass.async_add_executor_job(
+            build_ssl_param,
+            verify_ssl,
+            entry.options.get(CONF_CA_CERT),
+            entry.options.get(CONF_SSL_FINGERPRINT),
+        )
+    except (OSError, ssl.SSLError, ValueError) as err:
+        raise ConfigEntryError(f"Invalid TLS settings: {err}") from err
+
+    if entry.options.get(CONF_DEDICATED_POOL, DEFAULT_DEDICATED_POOL):
+        # Own keep-alive pool so TLS sessions to PMG are reused across polls.
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=entry.options.get(
+                    CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+                ),
+                keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=POOL_DNS_CACHE_TTL,
+                ssl=ssl_param,
+            )
+        )
+        close = session.close
+    else:
+        session = async_get_clientsession(hass)
+        close = None
+
     client = PMGApiClient(
         session=session,
         host=entry.data[CONF_HOST],
@@ -46,16 +178,93 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
         realm=entry.data[CONF_REALM],
-        verify_ssl=entry.options.get(
-            CONF_VERIFY_SSL,
-            entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
-        ),
+        verify_ssl=verify_ssl,
+        cache_ttl=CACHE_TTL,
+        ssl_param=ssl_param,
+        rate_limit=entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+        rate_burst=entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+        request_weights=REQUEST_WEIGHTS,
+    )
+
+    storage = async_get_storage(hass, entry.entry_id)
+    await storage.async_load()
+    entry.async_on_unload(storage.async_flush)
+
+    # Entries of one cluster share a client: one login, and cluster-wide
+    # data fetched by one entry is served to the others from the cache. The
+    # cluster is identified after the first refresh, so setup never waits on
+    # PMG; until then, and after the cluster changes, that applies on reload.
+    hub = None
+    if storage.cluster_key is not None:
+        settings = (
+            entry.data[CONF_PASSWORD],
+            verify_ssl,
+            entry.options.get(CONF_CA_CERT),
+            entry.options.get(CONF_SSL_FINGERPRINT),
+            entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+            entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+            # Size of the dedicated pool; False for the shared session.
+            close is not None
+            and entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+        )
+        hub = async_acquire_hub(
+            hass, storage.cluster_key, settings, entry.entry_id, client, close
+        )
+        entry.async_on_unload(lambda: async_release_hub(hass, hub, entry.entry_id))
+        if hub.client is not client:
+            client = hub.client
+            client.add_endpoint(entry.data[CONF_HOST], entry.data[CONF_PORT])
+            if close is not None:
+                await close()
+    elif close is not None:
+        entry.async_on_unload(close)
+
+    scheduler: PMGDomainScheduler = hass.data.setdefault(
+        DATA_SCHEDULER, PMGDomainScheduler(DOMAIN_MAX_REFRESHES)
     )
+    scheduler.register(entry.entry_id)
+    entry.async_on_unload(lambda: scheduler.unregister(entry.entry_id))
 
-    coordinator = PMGDataUpdateCoordinator(hass, client, entry)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = PMGDataUpdateCoordinator(
+        hass, client, entry, storage, hub, scheduler
+    )
+    entry.async_on_unload(coordinator.async_cancel_live)
+    if syslog_port := entry.options.get(CONF_SYSLOG_PORT, DEFAULT_SYSLOG_PORT):
+        # Mail counters follow the mail log in real time; polls reconcile them.
+        coordinator.syslog_sources.update(
+            await async_resolve_sources([endpoint.host for endpoint in client.endpoints])
+        )
+        if not coordinator.syslog_sources:
+            # The listener is bound on every interface; never count unknown senders.
+            coordinator.logger.warning(
+                "Could not resolve %s, syslog is ignored until a node address is known",
+                entry.data[CONF_HOST],
+            )
+        try:
+            coordinator.syslog, unsubscribe = await async_subscribe_syslog(
+                hass,
+                syslog_port,
+                coordinator.syslog_sources,
+                coordinator.async_add_live_stats,
+            )
+        except OSError as err:
+            coordinator.logger.error(
+                "Could not listen for syslog on port %s: %s", syslog_port, err
+            )
+        else:
+            entry.async_on_unload(unsubscribe)
+    if entry.options.get(CONF_FAST_STARTUP, DEFAULT_FAST_STARTUP) and storage.snapshot:
+        # Entities are created from the last known data; the first real
+        # refresh runs in the background so PMG latency does not block setup.
+        coordinator.async_restore(storage.snapshot)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_{entry.entry_id}_first_refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    async_setup_services(hass)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -65,79 +274,584 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        async_unload_services(hass)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    storage = hass.data.get(DATA_STORAGE, {}).pop(entry.entry_id, None)
+    if storage is None:
+        storage = PMGStorage(hass, entry.entry_id)
+    await storage.async_remove()
+
+
+@dataclass
+class PMGSectionState:
+    """Fetch state of one data section."""
+
+    last_success: datetime | None = None
+    last_error: str | None = None
+    failures: int = 0
+    # Monotonic start of the last successful fetch, and of the next retry.
+    refreshed: float | None = None
+    retry_at: float = 0.0
+
+    @property
+    def stale(self) -> bool:
+        return self.failures > 0
+
+
 class PMGDataUpdateCoordinator(DataUpdateCoordinator[dict]):
-    """Coordinator for PMG data."""
+    """Coordinator for PMG data.
+
+    Ticks at the shortest tier interval and only fetches the tiers that are
+    due. Entities pass their tier as listener context and are only notified
+    when that tier was refreshed.
+    """
 
-    def __init__(self, hass: HomeAssistant, client: PMGApiClient, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: PMGApiClient,
+        entry: ConfigEntry,
+        storage: PMGStorage,
+        hub: PMGClusterHub | None = None,
+        scheduler: PMGDomainScheduler | None = None,
+    ) -> None:
         self.client = client
+        self.hub = hub
+        self.scheduler = scheduler
         self.entry = entry
-        update_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        self.storage = storage
+        self.restored = False
+        self.snapshot = PMGSnapshot()
+        # Mail counters from syslog since the last /statistics/mail poll.
+        self.live = PMGLiveStats()
+        self.syslog: PMGSyslogServer | None = None
+        self.syslog_sources: set[str] = set()
+        self._polled_mail_stats: dict[str, float] = {}
+        self._polled_windows: dict[int, dict[str, float]] = {}
+        self._live_unsub: Callable[[], None] | None = None
+        self._tier_intervals: dict[str, int] = {
+            TIER_NODES: entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            # Entries from before the tiers polled mail at scan_interval.
+            TIER_MAIL: entry.options.get(
+                CONF_MAIL_SCAN_INTERVAL,
+                entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_MAIL_SCAN_INTERVAL),
+            ),
+            TIER_SYSTEM: entry.options.get(
+                CONF_SYSTEM_SCAN_INTERVAL, DEFAULT_SYSTEM_SCAN_INTERVAL
+            ),
+        }
+        # Sections still being fetched, possibly past the refresh that started them.
+        self._section_tasks: dict[str, asyncio.Task[dict[str, Any] | None]] = {}
+        self.adaptive: PMGAdaptiveInterval | None = None
+        self.backoff: PMGBackoff | None = None
+        if entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+            maximum = entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+            self.adaptive = PMGAdaptiveInterval(
+                self._tier_intervals[TIER_MAIL],
+                entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+                maximum,
+            )
+            self.backoff = PMGBackoff(min(self._tier_intervals.values()), maximum)
+        self.sections: dict[str, PMGSectionState] = {
+            section: PMGSectionState() for section in SECTION_TIMEOUTS
+        }
+        self.tracker: PMGTracker | None = None
+        # Sections switched off in the options are never fetched.
+        self._disabled_sections: set[str] = set()
+        if entry.options.get(CONF_MESSAGE_TRACKER, DEFAULT_MESSAGE_TRACKER):
+            self.tracker = PMGTracker(storage.tracker_cursors)
+        else:
+            self._disabled_sections.add(SECTION_TRACKER)
+        self.mailcount: PMGMailCountSeries | None = None
+        if timespan := entry.options.get(
+            CONF_MAILCOUNT_TIMESPAN, DEFAULT_MAILCOUNT_TIMESPAN
+        ):
+            self.mailcount = PMGMailCountSeries(timespan)
+        else:
+            self._disabled_sections.add(SECTION_MAILCOUNT)
+        self._updated_tiers: set[str] | None = None
+        # Duration in milliseconds of each section and phase of the last refresh.
+        self.phase_timings: dict[str, float] = {}
+        self._stats_cache = PMGMailStatsCache(storage.stats_days)
+        # Windows besides CONF_STATS_DAYS, served from the same day buckets.
+        self.stats_windows = [
+            days
+            for days in parse_windows(
+                entry.options.get(CONF_STATS_WINDOWS, DEFAULT_STATS_WINDOWS)
+            )
+            if days != entry.options.get(CONF_STATS_DAYS, DEFAULT_STATS_DAYS)
+        ]
+        self.capabilities = PMGCapabilityCache()
+        self._cluster_checked = False
+        # Bounds the number of requests in flight against pmgproxy per refresh.
+        self._semaphore = asyncio.Semaphore(
+            entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
+        )
 
         super().__init__(
             hass,
             logger=logging.getLogger(__name__),
             name=f"{DOMAIN}_{entry.entry_id}",
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=timedelta(seconds=min(self._tier_intervals.values())),
         )
 
-    async def _async_update_data(self) -> dict:
+    @callback
+    def async_restore(self, snapshot: dict) -> None:
+        """Serve a stored snapshot until the first refresh completes."""
+        self.data = project_data(snapshot)
+        self.snapshot = self._build_snapshot(self.data)
+        self.restored = True
+
+    def _build_snapshot(self, data: dict[str, Any]) -> PMGSnapshot:
+        snapshot = PMGSnapshot.from_data(data)
+        self._polled_mail_stats = snapshot.mail_stats
+        self._polled_windows = snapshot.mail_stats_windows
+        if self.live.empty:
+            return snapshot
+        return self._apply_live(snapshot)
+
+    def _apply_live(self, snapshot: PMGSnapshot) -> PMGSnapshot:
+        # Every window ends today, so live events count towards all of them.
+        return replace(
+            snapshot,
+            mail_stats=self.live.apply(self._polled_mail_stats),
+            mail_stats_windows={
+                days: self.live.apply(stats)
+                for days, stats in self._polled_windows.items()
+            },
+        )
+
+    @callback
+    def async_add_live_stats(self, deltas: dict[str, float]) -> None:
+        self.live.add(deltas)
+        if self._live_unsub is None:
+            # Bursts of log lines end up in one state write.
+            self._live_unsub = async_call_later(
+                self.hass, LIVE_UPDATE_DELAY, self._async_publish_live
+            )
+
+    @callback
+    def _async_publish_live(self, _now: datetime) -> None:
+        self._live_unsub = None
+        if self.data is None:
+            return
+        self.snapshot = self._apply_live(self.snapshot)
+        self._updated_tiers = {TIER_MAIL}
+        self.async_update_listeners()
+
+    @callback
+    def async_cancel_live(self) -> None:
+        if self._live_unsub is not None:
+            self._live_unsub()
+            self._live_unsub = None
+
+    def _due_sections(self) -> set[str]:
+        now = time.monotonic()
+        # Half a tick of slack so timer jitter does not push a section back a whole tick.
+        slack = min(self._tier_intervals.values()) / 2
+        due = set()
+        for section, state in self.sections.items():
+            if section in self._disabled_sections or section in self._section_tasks:
+                continue
+            if state.failures:
+                due_at = state.retry_at
+            elif state.refreshed is not None:
+                due_at = state.refreshed + self._tier_intervals[SECTION_TIERS[section]]
+            else:
+                due_at = 0
+            if now + slack >= due_at:
+                due.add(section)
+        return due
+
+    @callback
+    def async_update_listeners(self) -> None:
+        tiers, self._updated_tiers = self._updated_tiers, None
+        if tiers is None:
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in tiers:
+                update_callback()
+
+    def _adapt_interval(self, tiers: set[str], failed: set[str]) -> None:
+        if self.adaptive is None or self.backoff is None:
+            return
+        self.backoff.reset()
+        if TIER_MAIL in tiers and not set(TIER_SECTIONS[TIER_MAIL]) & failed:
+            snapshot = self.snapshot
+            self._tier_intervals[TIER_MAIL] = self.adaptive.observe(
+                time.monotonic(),
+                {
+                    "mail": snapshot.mail_stats.get("count"),
+                    "spam": snapshot.spam_count,
+                    "virus": snapshot.virus_count,
+                },
+            )
+        self.update_interval = timedelta(seconds=min(self._tier_intervals.values()))
+
+    async def _async_get(
+        self, path: str, params: dict[str, Any] | None = None, *, tier: str
+    ) -> Any:
+        ttl = None
+        if self.hub is not None and self.hub.shared:
+            # Another entry of the cluster may just have fetched the same data.
+            ttl = self._tier_intervals[tier] * SHARED_TTL_FACTOR
+        async with self._semaphore:
+            return await self.client.async_get(path, params=params, ttl=ttl)
+
+    async def _async_fetch_updates(self, node_name: str) -> Any:
+        if not self.capabilities.supported(node_name, ENDPOINT_APT_UPDATE):
+            return None
         try:
-            version = await self.client.async_get("/version")
-
-            nodes_data = await self.client.async_get("/nodes") or []
-            nodes = {}
-            updates: dict[str, Any] = {}
-            for node in nodes_data:
-                node_name = node.get("node") or node.get("name")
-                if not node_name:
-                    continue
-                status = await self.client.async_get(f"/nodes/{node_name}/status")
-                nodes[node_name] = status or {}
-                try:
-                    updates_data = await self.client.async_get(
-                        f"/nodes/{node_name}/apt/update"
-                    )
-                except PMGApiError as err:
-                    if (
-                        "404" in str(err)
-                        or "401" in str(err)
-                        or "403" in str(err)
-                        or "501" in str(err)
-                        or "not implemented" in str(err).lower()
-                    ):
-                        updates_data = None
-                    else:
-                        raise
-                updates[node_name] = updates_data
-
-            stats_days = self.entry.options.get(CONF_STATS_DAYS, DEFAULT_STATS_DAYS)
-            now = dt_util.utcnow()
-            end = now.replace(hour=23, minute=59, second=59, microsecond=0)
-            start = (end - timedelta(days=stats_days - 1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            mail_stats = await self.client.async_get(
-                "/statistics/mail",
-                params={"starttime": int(start.timestamp()), "endtime": int(end.timestamp())},
+            return project_updates(
+                await self._async_get(
+                    f"/nodes/{node_name}/{ENDPOINT_APT_UPDATE}", tier=TIER_SYSTEM
+                )
             )
+        except PMGApiError as err:
+            if err.status in UNSUPPORTED_STATUSES:
+                self.capabilities.mark_unsupported(node_name, ENDPOINT_APT_UPDATE)
+                return None
+            raise
 
-            quarantine_params = {
-                "starttime": int(start.timestamp()),
-                "endtime": int(end.timestamp()),
-            }
-            spam_status = await self.client.async_get("/quarantine/spamstatus")
-            virus_status = await self.client.async_get("/quarantine/virusstatus")
-
-            return {
-                "version": version,
-                "nodes": nodes,
-                "updates": updates,
-                "mail_stats": mail_stats,
-                "spam_status": spam_status,
-                "virus_status": virus_status,
+    async def _async_fetch_node_names(self) -> list[str]:
+        nodes_data = await self._async_get("/nodes", tier=TIER_NODES) or []
+        return [
+            node_name
+            for node in nodes_data
+            if (node_name := node.get("node") or node.get("name"))
+        ]
+
+    async def _async_fetch_nodes(self, node_names: Awaitable[list[str]]) -> dict[str, Any]:
+        names = await node_names
+        statuses = await asyncio.gather(
+            *(
+                self._async_get(f"/nodes/{node_name}/status", tier=TIER_NODES)
+                for node_name in names
+            )
+        )
+        return {
+            "nodes": {
+                node_name: project_status(status)
+                for node_name, status in zip(names, statuses)
             }
+        }
+
+    async def _async_fetch_all_updates(
+        self, node_names: Awaitable[list[str]]
+    ) -> dict[str, Any]:
+        names = await node_names
+        updates = await asyncio.gather(
+            *(self._async_fetch_updates(node_name) for node_name in names)
+        )
+        return {"updates": dict(zip(names, updates))}
+
+    async def _async_fetch_stats_day(self, day: int, cache: bool) -> dict[str, float]:
+        stats = flatten_stats(
+            await self._async_get(
+                "/statistics/mail",
+                params={"starttime": day, "endtime": day + DAY - 1},
+                tier=TIER_MAIL,
+            )
+        )
+        if cache:
+            # Stored as soon as it arrives so a section timeout keeps progress.
+            self._stats_cache.set(day, stats)
+        return stats
+
+    async def _async_fetch_stats(self) -> dict[str, Any]:
+        stats_days = self.entry.options.get(CONF_STATS_DAYS, DEFAULT_STATS_DAYS)
+        windows = [stats_days, *self.stats_windows]
+        closed_days, open_days = split_window(
+            int(dt_util.utcnow().timestamp()), max(windows)
+        )
+        # Log events up to here are part of the totals fetched below.
+        checkpoint = self.live.checkpoint()
+        # Closed days never change, so they are fetched once and served from
+        # the cache; only the still open day(s) are queried on every poll.
+        self._stats_cache.prune((closed_days or open_days)[0])
+        open_stats = await asyncio.gather(
+            *(
+                self._async_fetch_stats_day(day, cache=True)
+                for day in self._stats_cache.missing(closed_days)
+            ),
+            *(self._async_fetch_stats_day(day, cache=False) for day in open_days),
+        )
+        self.live.discard(checkpoint)
+        # All windows come from one set of day buckets. Extra windows cost no
+        # requests per poll, only the one-off fetch of their older closed days.
+        totals = self._stats_cache.windows(
+            closed_days + open_days,
+            dict(zip(open_days, open_stats[len(open_stats) - len(open_days) :])),
+            windows,
+        )
+        return {
+            "mail_stats": totals[stats_days],
+            "mail_stats_windows": {
+                str(days): totals[days] for days in self.stats_windows
+            },
+        }
+
+    async def _async_fetch_node_tracker(
+        self, tracker: PMGTracker, node_name: str, now: int
+    ) -> None:
+        if not self.capabilities.supported(node_name, ENDPOINT_TRACKER):
+            return
+        try:
+            entries = await self._async_get(
+                f"/nodes/{node_name}/{ENDPOINT_TRACKER}",
+                params=tracker.params(node_name, now),
+                tier=TIER_MAIL,
+            )
         except PMGApiError as err:
-            raise UpdateFailed(str(err)) from err
+            if err.status in UNSUPPORTED_STATUSES:
+                # The tracker needs audit permissions on the node.
+                self.capabilities.mark_unsupported(node_name, ENDPOINT_TRACKER)
+                return
+            raise
+        tracker.ingest(node_name, entries, now)
+
+    async def _async_fetch_tracker(
+        self, node_names: Awaitable[list[str]]
+    ) -> dict[str, Any]:
+        tracker = self.tracker
+        if tracker is None:
+            return {}
+        names = await node_names
+        now = int(dt_util.utcnow().timestamp())
+        # Only entries after each node's cursor are fetched, not the whole window.
+        await asyncio.gather(
+            *(
+                self._async_fetch_node_tracker(tracker, node_name, now)
+                for node_name in names
+            )
+        )
+        if names:
+            tracker.prune(names)
+        self.storage.tracker_cursors = tracker.cursors
+        return {"tracker_rates": tracker.rates(now)}
+
+    async def _async_fetch_mailcount(self) -> dict[str, Any]:
+        series = self.mailcount
+        if series is None:
+            return {}
+        now = int(dt_util.utcnow().timestamp())
+        series.ingest(
+            await self._async_get(
+                "/statistics/mailcount", params=series.params(now), tier=TIER_MAIL
+            ),
+            now,
+        )
+        rates: dict[str, dict[str, float]] = {}
+        for name, seconds in MAIL_RATE_WINDOWS.items():
+            window = series.window(seconds, now)
+            rates[name] = {key: round(value, 1) for key, value in window.items()}
+        return {"mail_rates": rates}
+
+    async def _async_fetch_quarantine(self) -> dict[str, Any]:
+        spam_status, virus_status = await asyncio.gather(
+            self._async_get("/quarantine/spamstatus", tier=TIER_MAIL),
+            self._async_get("/quarantine/virusstatus", tier=TIER_MAIL),
+        )
+        return {
+            "spam_status": project_quarantine(spam_status),
+            "virus_status": project_quarantine(virus_status),
+        }
+
+    async def _async_fetch_version(self) -> dict[str, Any]:
+        version = await self._async_get("/version", tier=TIER_SYSTEM)
+        self.capabilities.set_version((version or {}).get("version"))
+        await self._async_discover_endpoints()
+        return {"version": project_version(version)}
+
+    async def _async_discover_endpoints(self) -> None:
+        """Let the client fail over to the other members of the cluster."""
+        if not self.capabilities.supported(CLUSTER, ENDPOINT_CLUSTER_STATUS):
+            return
+        try:
+            status = await self._async_get(f"/{ENDPOINT_CLUSTER_STATUS}", tier=TIER_SYSTEM)
+        except PMGApiError as err:
+            if err.status in UNSUPPORTED_STATUSES:
+                self.capabilities.mark_unsupported(CLUSTER, ENDPOINT_CLUSTER_STATUS)
+            else:
+                self.logger.debug("Fetching PMG cluster members failed: %s", err)
+            return
+        for node in status or []:
+            if not isinstance(node, dict) or not node.get("ip"):
+                continue
+            if self.syslog is not None:
+                self.syslog_sources.add(node["ip"])
+            if self.client.pinned and not node.get("fingerprint"):
+                # The pinned certificate only belongs to the configured node.
+                continue
+            self.client.add_endpoint(node["ip"], fingerprint=node.get("fingerprint"))
+
+    async def _async_check_cluster(self) -> None:
+        """Identify the cluster again; a changed key is used from the next setup."""
+        key = await async_cluster_key(self.client, self.entry.data[CONF_HOST])
+        if key is None or key == self.storage.cluster_key:
+            return
+        self.logger.debug("PMG cluster of %s is now %s", self.entry.data[CONF_HOST], key)
+        self.storage.cluster_key = key
+
+    async def _async_run_section(
+        self, section: str, fetch: Awaitable[dict[str, Any]]
+    ) -> dict[str, Any] | None:
+        state = self.sections[section]
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(SECTION_TIMEOUTS[section]):
+                result = await fetch
+        except (PMGApiError, TimeoutError) as err:
+            state.failures += 1
+            state.last_error = str(err) or f"timed out after {SECTION_TIMEOUTS[section]}s"
+            self.logger.debug("Fetching PMG %s failed: %s", section, state.last_error)
+            # Only this section is retried, from the next tick on with backoff.
+            tick = min(self._tier_intervals.values())
+            state.retry_at = time.monotonic() + min(
+                tick * 2 ** (state.failures - 1),
+                self._tier_intervals[SECTION_TIERS[section]],
+            )
+            return None
+        finally:
+            self.phase_timings[section] = round((time.monotonic() - started) * 1000, 1)
+        state.failures = 0
+        state.last_error = None
+        state.last_success = dt_util.utcnow()
+        state.refreshed = started
+        return result
+
+    @callback
+    def _async_section_finished(
+        self, section: str, task: asyncio.Task[dict[str, Any] | None]
+    ) -> None:
+        """Publish a section that outlasted the refresh that started it."""
+        if self._section_tasks.get(section) is task:
+            del self._section_tasks[section]
+        if task.cancelled() or self.data is None:
+            return
+        tier = SECTION_TIERS[section]
+        if (result := task.result()) is not None:
+            data = {**self.data, **result}
+            self.data = data
+            self.snapshot = self._build_snapshot(data)
+            self._adapt_interval({tier}, set())
+            self.storage.async_schedule_save(self._stats_cache.days, data)
+        # Entities of a failed section still pick up that it is stale.
+        self._updated_tiers = {tier}
+        self.async_update_listeners()
+
+    async def _async_update_data(self) -> dict:
+        scheduler = self.scheduler
+        if scheduler is None:
+            return await self._async_update_tiers()
+        async with scheduler.semaphore:
+            data = await self._async_update_tiers()
+        # Poll again at this entry's slot so entries do not refresh in step.
+        self.update_interval = timedelta(
+            seconds=scheduler.delay(
+                self.entry.entry_id,
+                min(self._tier_intervals.values()),
+                time.monotonic(),
+            )
+        )
+        return data
+
+    async def _async_update_tiers(self) -> dict:
+        sections = self._due_sections()
+        started = time.monotonic()
+
+        names_task: asyncio.Task[list[str]] | None = None
+        if SECTION_NODES in sections:
+            names_task = asyncio.create_task(self._async_fetch_node_names())
+
+        async def _node_names() -> list[str]:
+            if names_task is not None:
+                try:
+                    return await asyncio.shield(names_task)
+                except PMGApiError:
+                    pass  # Reported by the nodes section.
+            return list((self.data or {}).get("nodes", {}))
+
+        fetchers: dict[str, Callable[[], Awaitable[dict[str, Any]]]] = {
+            SECTION_NODES: lambda: self._async_fetch_nodes(asyncio.shield(names_task)),
+            SECTION_UPDATES: lambda: self._async_fetch_all_updates(_node_names()),
+            SECTION_STATS: self._async_fetch_stats,
+            SECTION_QUARANTINE: self._async_fetch_quarantine,
+            SECTION_VERSION: self._async_fetch_version,
+            SECTION_TRACKER: lambda: self._async_fetch_tracker(_node_names()),
+            SECTION_MAILCOUNT: self._async_fetch_mailcount,
+        }
+        tasks = {
+            section: self.entry.async_create_background_task(
+                self.hass,
+                self._async_run_section(section, fetchers[section]()),
+                f"{DOMAIN}_{self.entry.entry_id}_{section}",
+            )
+            for section in fetchers
+            if section in sections
+        }
+        self._section_tasks.update(tasks)
+        results: dict[str, dict[str, Any] | None] = {}
+        try:
+            if tasks:
+                # The first refresh waits for every section; entities are created from it.
+                await asyncio.wait(
+                    tasks.values(),
+                    timeout=SECTION_WAIT if self.data is not None else None,
+                )
+        finally:
+            for section, task in tasks.items():
+                if task.done():
+                    del self._section_tasks[section]
+                    results[section] = task.result()
+                else:
+                    # A slow section does not hold back the others.
+                    task.add_done_callback(partial(self._async_section_finished, section))
+        if names_task is not None and not names_task.done():
+            if len(results) == len(tasks):
+                names_task.cancel()
+            else:
+                names_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+        failed = {section for section, result in results.items() if result is None}
+        if tasks and len(results) == len(tasks) and failed == set(results):
+            self.phase_timings["total"] = round((time.monotonic() - started) * 1000, 1)
+            if self.backoff is not None:
+                self.update_interval = timedelta(seconds=self.backoff.failed())
+            raise UpdateFailed(
+                "; ".join(
+                    f"{section}: {self.sections[section].last_error}"
+                    for section in results
+                )
+            )
+
+        # Sections that failed keep their last good data.
+        data = dict(self.data or {})
+        for result in results.values():
+            if result is not None:
+                data.update(result)
+
+        tiers = {SECTION_TIERS[section] for section in results}
+        # After a failed refresh every entity has to pick up its availability again.
+        self._updated_tiers = tiers if self.last_update_success else None
+        self.restored = False
+        merged = time.monotonic()
+        self.snapshot = self._build_snapshot(data)
+        if results:
+            self._adapt_interval(tiers, failed)
+        self.storage.async_schedule_save(self._stats_cache.days, data)
+        if not self._cluster_checked:
+            self._cluster_checked = True
+            self.entry.async_create_background_task(
+                self.hass,
+                self._async_check_cluster(),
+                f"{DOMAIN}_{self.entry.entry_id}_cluster_key",
+            )
+        finished = time.monotonic()
+        self.phase_timings["snapshot"] = round((finished - merged) * 1000, 1)
+        self.phase_timings["total"] = round((finished - started) * 1000, 1)
+        return data
@@ -2,24 +2,306 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, TypeVar
 
 import asyncio
+import logging
+import math
+import ssl
+import time
 import aiohttp
 from aiohttp import ClientError, ContentTypeError
 
 from .const import COOKIE_NAME
 
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# PMG tickets expire after two hours; renew them well before that.
+TICKET_RENEW_AFTER = 5400  # seconds
+
+DEFAULT_CACHE_SIZE = 128
+
+# Responses that mean an endpoint is missing or not permitted for this user.
+UNSUPPORTED_STATUSES = frozenset({401, 403, 404, 501})
+CAPABILITY_TTL = 21600  # seconds
+
+# Latencies kept per path for the percentiles in request statistics.
+LATENCY_SAMPLES = 256
+
+LOGIN_PATH = "/access/ticket"
+
+# Replies from pmgproxy that mean the node itself cannot serve the request.
+FAILOVER_STATUSES = frozenset({502, 503, 504, 595, 596})
+# Consecutive failures that open an endpoint's circuit breaker.
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 30  # seconds, doubled on every failed probe
+BREAKER_MAX_COOLDOWN = 600  # seconds
+LATENCY_SMOOTHING = 0.2
+# Every Nth request goes to the least recently used endpoint to measure it.
+PROBE_INTERVAL = 50
+# Bounds connection setup so an unreachable node fails over quickly.
+CONNECT_TIMEOUT = 5  # seconds
+# Bounds a whole request so a node that stops answering fails over too.
+REQUEST_TIMEOUT = 30  # seconds
+
+
+_RequestKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+
+def _consume_exception(task: asyncio.Task[Any]) -> None:
+    # Results of shared tasks are retrieved by whoever awaits them; mark the
+    # exception as retrieved so an abandoned task does not log a warning.
+    if not task.cancelled():
+        task.exception()
+
+
+SSLParam = ssl.SSLContext | aiohttp.Fingerprint | bool
+
+
+def build_ssl_param(
+    verify_ssl: bool, ca_cert: str | None = None, fingerprint: str | None = None
+) -> SSLParam:
+    """Build the aiohttp ssl argument once per client.
+
+    A pinned SHA-256 fingerprint replaces CA validation. Loading a custom CA
+    reads from disk, so call this from an executor.
+    """
+    if fingerprint:
+        return aiohttp.Fingerprint(bytes.fromhex(fingerprint.replace(":", "")))
+    if not verify_ssl:
+        return False
+    if ca_cert:
+        return ssl.create_default_context(cafile=ca_cert)
+    return True
+
 
 class PMGApiError(Exception):
     """Base error for PMG API."""
 
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        # HTTP status of the failed response, None for connection errors.
+        self.status = status
+
+
+def stats_path(path: str) -> str:
+    """Group per-node paths, e.g. /nodes/pmg1/status -> /nodes/{node}/status."""
+    parts = path.split("/")
+    if len(parts) > 2 and parts[1] == "nodes":
+        parts[2] = "{node}"
+    return "/".join(parts)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float | None:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class PMGRequestStats:
+    """Counters and recent latencies of one API path."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes = 0
+        self.max_latency = 0.0
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, latency: float, size: int, error: bool) -> None:
+        self.requests += 1
+        self.errors += error
+        self.bytes += size
+        self.max_latency = max(self.max_latency, latency)
+        self.latencies.append(latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+        p50 = _percentile(ordered, 0.5)
+        p95 = _percentile(ordered, 0.95)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "max_ms": round(self.max_latency * 1000, 1),
+        }
+
+
+class PMGRateLimiter:
+    """Token bucket shared by every request of a client.
+
+    Requests take as many tokens as their weight and wait in FIFO order
+    while the bucket is empty instead of being sent right away.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waiting = 0
+        self.max_waiting = 0
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def async_acquire(self, weight: float) -> None:
+        weight = min(weight, self.burst)
+        started = time.monotonic()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._tokens = min(
+                        self.burst, self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= weight:
+                        self._tokens -= weight
+                        break
+                    await asyncio.sleep((weight - self._tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+        wait = time.monotonic() - started
+        self.acquired += 1
+        if wait > 0.001:
+            self.delayed += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "queue_depth": self.waiting,
+            "max_queue_depth": self.max_waiting,
+            "requests": self.acquired,
+            "delayed": self.delayed,
+            "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 1)
+            if self.acquired
+            else 0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+        }
+
+
+class PMGEndpoint:
+    """One pmgproxy address with a latency estimate and a circuit breaker."""
+
+    def __init__(self, host: str, port: int, ssl_param: SSLParam | None = None) -> None:
+        self.host = host
+        self.port = port
+        # Overrides the client's ssl argument, for a member's own pinned certificate.
+        self.ssl = ssl_param
+        self.latency: float | None = None
+        self.failures = 0
+        self.open_until = 0.0
+        self.last_used = 0.0
+        self._cooldown: float = BREAKER_COOLDOWN
+
+    @property
+    def url(self) -> str:
+        host = f"[{self.host}]" if ":" in self.host else self.host
+        return f"https://{host}:{self.port}/api2/json"
+
+    def available(self, now: float) -> bool:
+        # Closed, or open long enough to let a probe through.
+        return self.open_until <= now
+
+    def record_success(self, latency: float | None) -> None:
+        self.last_used = time.monotonic()
+        self.failures = 0
+        self.open_until = 0.0
+        self._cooldown = BREAKER_COOLDOWN
+        if latency is not None:
+            self.latency = (
+                latency
+                if self.latency is None
+                else self.latency + (latency - self.latency) * LATENCY_SMOOTHING
+            )
+
+    def record_failure(self) -> None:
+        now = self.last_used = time.monotonic()
+        self.failures += 1
+        if self.failures >= BREAKER_THRESHOLD:
+            self.open_until = now + self._cooldown
+            self._cooldown = min(self._cooldown * 2, BREAKER_MAX_COOLDOWN)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "host": self.host,
+            "port": self.port,
+            "latency_ms": round(self.latency * 1000, 1)
+            if self.latency is not None
+            else None,
+            "failures": self.failures,
+            "open": self.open_until > time.monotonic(),
+        }
+
+
+class PMGCapabilityCache:
+    """Per-node endpoints that PMG rejected as unsupported or forbidden.
+
+    Entries expire after a TTL and are dropped when the PMG version changes,
+    so an upgrade or permission change is picked up again.
+    """
+
+    def __init__(self, ttl: float = CAPABILITY_TTL) -> None:
+        self._ttl = ttl
+        self._unsupported: dict[tuple[str, str], float] = {}
+        self._version: str | None = None
+
+    def supported(self, node: str, endpoint: str) -> bool:
+        expires = self._unsupported.get((node, endpoint))
+        if expires is None:
+            return True
+        if expires <= time.monotonic():
+            del self._unsupported[(node, endpoint)]
+            return True
+        return False
+
+    def mark_unsupported(self, node: str, endpoint: str) -> None:
+        self._unsupported[(node, endpoint)] = time.monotonic() + self._ttl
+
+    def set_version(self, version: str | None) -> None:
+        if version != self._version:
+            self._unsupported.clear()
+            self._version = version
+
+    def as_dict(self) -> dict[str, list[str]]:
+        unsupported: dict[str, list[str]] = {}
+        for node, endpoint in self._unsupported:
+            unsupported.setdefault(node, []).append(endpoint)
+        return unsupported
+
 
 @dataclass
 class PMGAuth:
     ticket: str
     csrf: str | None
+    issued: float = field(default_factory=time.monotonic)
+    headers: dict[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Built once per ticket instead of on every request.
+        self.headers = {"Cookie": f"{COOKIE_NAME}={self.ticket}"}
+        if self.csrf:
+            self.headers["CSRFPreventionToken"] = self.csrf
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.issued
 
 
 class PMGApiClient:
@@ -34,6 +316,12 @@ class PMGApiClient:
         password: str,
         realm: str,
         verify_ssl: bool,
+        cache_ttl: dict[str, float] | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        ssl_param: SSLParam | None = None,
+        rate_limit: float = 0,
+        rate_burst: float = 1,
+        request_weights: dict[str, float] | None = None,
     ) -> None:
         self._session = session
         self._host = host
@@ -42,11 +330,119 @@ class PMGApiClient:
         self._password = password
         self._realm = realm
         self._verify_ssl = verify_ssl
+        self._ssl: SSLParam = (
+            ssl_param if ssl_param is not None else build_ssl_param(verify_ssl)
+        )
+        self._endpoints = [PMGEndpoint(host, port)]
+        self._selections = 0
+        self._timeout = aiohttp.ClientTimeout(
+            total=REQUEST_TIMEOUT, sock_connect=CONNECT_TIMEOUT
+        )
         self._auth: PMGAuth | None = None
+        self._login_task: asyncio.Task[PMGAuth] | None = None
+        self._cache_ttl = cache_ttl or {}
+        self._cache_size = cache_size
+        self._cache: OrderedDict[_RequestKey, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[_RequestKey, asyncio.Task[Any]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.coalesced = 0
+        self.request_stats: dict[str, PMGRequestStats] = {}
+        self.rate_limiter = (
+            PMGRateLimiter(rate_limit, rate_burst) if rate_limit > 0 else None
+        )
+        self._request_weights = request_weights or {}
+        self.logins = 0
+        self.relogins = 0
 
     @property
     def base_url(self) -> str:
-        return f"https://{self._host}:{self._port}/api2/json"
+        return self._endpoints[0].url
+
+    @property
+    def endpoints(self) -> list[PMGEndpoint]:
+        return self._endpoints
+
+    @property
+    def pinned(self) -> bool:
+        """Whether the certificate is pinned rather than validated."""
+        return isinstance(self._ssl, aiohttp.Fingerprint)
+
+    def add_endpoint(
+        self, host: str, port: int | None = None, fingerprint: str | None = None
+    ) -> None:
+        """Add another member of the cluster to fail over to.
+
+        With a pinned certificate the member is checked against its own
+        fingerprint if one is given, otherwise against the pinned one.
+        """
+        port = port or self._port
+        if any(
+            endpoint.host == host and endpoint.port == port
+            for endpoint in self._endpoints
+        ):
+            return
+        ssl_param = None
+        if fingerprint and self.pinned:
+            try:
+                ssl_param = build_ssl_param(True, fingerprint=fingerprint)
+            except ValueError:
+                _LOGGER.debug("Not failing over to %s, invalid fingerprint", host)
+                return
+        self._endpoints.append(PMGEndpoint(host, port, ssl_param))
+
+    def _endpoint_ssl(self, endpoint: PMGEndpoint) -> SSLParam:
+        return endpoint.ssl if endpoint.ssl is not None else self._ssl
+
+    def _select_endpoint(self, tried: list[PMGEndpoint]) -> PMGEndpoint | None:
+        now = time.monotonic()
+        remaining = [endpoint for endpoint in self._endpoints if endpoint not in tried]
+        candidates = [endpoint for endpoint in remaining if endpoint.available(now)]
+        if not candidates:
+            if tried or not remaining:
+                return None
+            # Every breaker is open; try the endpoint that would close first.
+            return min(remaining, key=lambda endpoint: endpoint.open_until)
+        self._selections += 1
+        if len(candidates) > 1 and self._selections % PROBE_INTERVAL == 0:
+            return min(candidates, key=lambda endpoint: endpoint.last_used)
+        # Unmeasured endpoints rank last; ties keep the configured host first.
+        return min(
+            candidates,
+            key=lambda endpoint: endpoint.latency
+            if endpoint.latency is not None
+            else math.inf,
+        )
+
+    async def _async_failover(
+        self, send: Callable[[PMGEndpoint], Awaitable[_T]]
+    ) -> _T:
+        """Send to the best endpoint, moving on while nodes are unreachable."""
+        tried: list[PMGEndpoint] = []
+        last_error: PMGApiError | None = None
+        while True:
+            endpoint = self._select_endpoint(tried)
+            if endpoint is None:
+                raise last_error or PMGApiError("No PMG endpoint available")
+            tried.append(endpoint)
+            started = time.monotonic()
+            try:
+                result = await send(endpoint)
+            except PMGApiError as err:
+                if err.status is not None and err.status not in FAILOVER_STATUSES:
+                    # The node answered; the request itself was refused.
+                    endpoint.record_success(None)
+                    raise
+                endpoint.record_failure()
+                last_error = err
+                _LOGGER.debug("PMG endpoint %s failed: %s", endpoint.host, err)
+                continue
+            endpoint.record_success(time.monotonic() - started)
+            return result
+
+    @property
+    def user(self) -> str:
+        return self._full_username()
 
     def _full_username(self) -> str:
         if "@" in self._username:
@@ -54,90 +450,239 @@ class PMGApiClient:
         return f"{self._username}@{self._realm}"
 
     async def async_login(self) -> PMGAuth:
-        url = f"{self.base_url}/access/ticket"
+        """Log in, sharing a single in-flight login between concurrent callers."""
+        if self._login_task is None:
+            self._login_task = asyncio.create_task(self._async_login())
+            self._login_task.add_done_callback(self._login_done)
+        return await asyncio.shield(self._login_task)
+
+    def _login_done(self, task: asyncio.Task[PMGAuth]) -> None:
+        if self._login_task is task:
+            self._login_task = None
+        _consume_exception(task)
+
+    async def _async_login(self) -> PMGAuth:
+        self.logins += 1
+        if self._auth is not None:
+            # Ticket renewal or a login after PMG rejected the ticket.
+            self.relogins += 1
+        payload = await self._async_failover(self._async_post_login)
+
+        auth_data = payload.get("data") or {}
+        ticket = auth_data.get("ticket")
+        if not ticket:
+            raise PMGApiError("Login failed: missing ticket")
+
+        self._auth = PMGAuth(ticket=ticket, csrf=auth_data.get("CSRFPreventionToken"))
+        return self._auth
+
+    def _request_weight(self, path: str) -> float:
+        path = stats_path(path)
+        for prefix, weight in self._request_weights.items():
+            if path.startswith(prefix):
+                return weight
+        return 1
+
+    async def _async_throttle(self, path: str) -> None:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.async_acquire(self._request_weight(path))
+
+    async def _async_post_login(self, endpoint: PMGEndpoint) -> Any:
+        await self._async_throttle(LOGIN_PATH)
+        url = f"{endpoint.url}{LOGIN_PATH}"
         data = {
             "username": self._full_username(),
             "password": self._password,
         }
-        ssl_context = False if not self._verify_ssl else None
+        started = time.monotonic()
+        size = 0
+        ok = False
         try:
-            async with self._session.post(url, data=data, ssl=ssl_context) as resp:
+            async with self._session.post(
+                url, data=data, ssl=self._endpoint_ssl(endpoint), timeout=self._timeout
+            ) as resp:
                 try:
                     payload = await resp.json()
                 except ContentTypeError:
                     text = await resp.text()
                     raise PMGApiError(
-                        f"Login failed: unexpected response {resp.status}: {text}"
+                        f"Login failed: unexpected response {resp.status}: {text}",
+                        status=resp.status,
                     ) from None
+                size = len(await resp.read())
                 if resp.status != 200:
-                    raise PMGApiError(f"Login failed: {resp.status} {payload}")
+                    raise PMGApiError(
+                        f"Login failed: {resp.status} {payload}", status=resp.status
+                    )
+                ok = True
         except (ClientError, ContentTypeError, asyncio.TimeoutError) as err:
             raise PMGApiError(f"Login failed: {err}") from err
+        finally:
+            self._path_stats(LOGIN_PATH).record(time.monotonic() - started, size, not ok)
+        return payload
 
-        auth_data = payload.get("data") or {}
-        ticket = auth_data.get("ticket")
-        if not ticket:
-            raise PMGApiError("Login failed: missing ticket")
-
-        self._auth = PMGAuth(ticket=ticket, csrf=auth_data.get("CSRFPreventionToken"))
-        return self._auth
+    async def _async_valid_auth(self) -> PMGAuth:
+        auth = self._auth
+        if auth is None or auth.age >= TICKET_RENEW_AFTER:
+            auth = await self.async_login()
+        return auth
 
-    async def async_get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        if self._auth is None:
-            await self.async_login()
+    def _path_stats(self, path: str) -> PMGRequestStats:
+        key = stats_path(path)
+        stats = self.request_stats.get(key)
+        if stats is None:
+            stats = self.request_stats[key] = PMGRequestStats()
+        return stats
 
-        url = f"{self.base_url}{path}"
-        headers = {}
-        if self._auth and self._auth.csrf:
-            headers["CSRFPreventionToken"] = self._auth.csrf
-        if self._auth and self._auth.ticket:
-            headers["Cookie"] = f"{COOKIE_NAME}={self._auth.ticket}"
-        cookies = None
+    async def _async_request(
+        self, path: str, params: dict[str, Any] | None, auth: PMGAuth
+    ) -> tuple[int, Any]:
+        return await self._async_failover(
+            lambda endpoint: self._async_request_endpoint(endpoint, path, params, auth)
+        )
 
-        ssl_context = False if not self._verify_ssl else None
+    async def _async_request_endpoint(
+        self,
+        endpoint: PMGEndpoint,
+        path: str,
+        params: dict[str, Any] | None,
+        auth: PMGAuth,
+    ) -> tuple[int, Any]:
+        await self._async_throttle(path)
+        url = f"{endpoint.url}{path}"
+        started = time.monotonic()
+        size = 0
+        status: int | None = None
         try:
             async with self._session.get(
                 url,
                 params=params,
-                headers=headers,
-                cookies=cookies,
-                ssl=ssl_context,
+                headers=auth.headers,
+                ssl=self._endpoint_ssl(endpoint),
+                timeout=self._timeout,
             ) as resp:
                 if resp.status == 401:
-                    await self.async_login()
-                    if self._auth and self._auth.ticket:
-                        headers["Cookie"] = f"{COOKIE_NAME}={self._auth.ticket}"
-                    ssl_context = False if not self._verify_ssl else None
-                    async with self._session.get(
-                        url,
-                        params=params,
-                        headers=headers,
-                        cookies=None,
-                        ssl=ssl_context,
-                    ) as retry_resp:
-                        try:
-                            payload = await retry_resp.json()
-                        except ContentTypeError:
-                            text = await retry_resp.text()
-                            raise PMGApiError(
-                                f"GET {path} failed: {retry_resp.status} {text}"
-                            ) from None
-                        if retry_resp.status != 200:
-                            raise PMGApiError(
-                                f"GET {path} failed: {retry_resp.status} {payload}"
-                            )
-                        return payload.get("data")
-
+                    status = resp.status
+                    return resp.status, None
                 try:
                     payload = await resp.json()
                 except ContentTypeError:
                     text = await resp.text()
                     raise PMGApiError(
-                        f"GET {path} failed: {resp.status} {text}"
+                        f"GET {path} failed: {resp.status} {text}", status=resp.status
                     ) from None
-                if resp.status != 200:
-                    raise PMGApiError(f"GET {path} failed: {resp.status} {payload}")
+                size = len(await resp.read())
+                status = resp.status
+                if status in FAILOVER_STATUSES:
+                    raise PMGApiError(f"GET {path} failed: {status} {payload}", status=status)
+                return resp.status, payload
         except (ClientError, ContentTypeError, asyncio.TimeoutError) as err:
             raise PMGApiError(f"GET {path} failed: {err}") from err
+        finally:
+            self._path_stats(path).record(
+                time.monotonic() - started, size, status != 200
+            )
+
+    @property
+    def request_totals(self) -> dict[str, int]:
+        stats = self.request_stats.values()
+        return {
+            "requests": sum(item.requests for item in stats),
+            "errors": sum(item.errors for item in stats),
+            "retries": sum(item.retries for item in stats),
+            "bytes": sum(item.bytes for item in stats),
+            "logins": self.logins,
+            "relogins": self.relogins,
+        }
+
+    def latency_percentile(self, fraction: float) -> float | None:
+        """Latency in seconds over the recent samples of all paths."""
+        return _percentile(
+            sorted(
+                latency
+                for path, stats in self.request_stats.items()
+                if path != LOGIN_PATH
+                for latency in stats.latencies
+            ),
+            fraction,
+        )
+
+    @property
+    def cache_info(self) -> dict[str, int]:
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "coalesced": self.coalesced,
+            "size": len(self._cache),
+        }
+
+    async def async_get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        ttl: float | None = None,
+    ) -> Any:
+        """GET a path, merging identical in-flight requests.
+
+        Paths with a configured TTL, or an explicit ttl, are served from an
+        LRU cache while fresh. Freshness is judged by the caller's own ttl,
+        so data fetched for a slower caller is not served to a faster one.
+        Results may be shared between callers and must not be mutated.
+        """
+        key: _RequestKey = (path, tuple(sorted((params or {}).items())))
+        if ttl is None:
+            ttl = self._cache_ttl.get(path)
+        if ttl:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached[1]
+            self.cache_misses += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._async_get_shared(key, path, params, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: _RequestKey, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        _consume_exception(task)
+
+    async def _async_get_shared(
+        self,
+        key: _RequestKey,
+        path: str,
+        params: dict[str, Any] | None,
+        ttl: float | None,
+    ) -> Any:
+        data = await self._async_get(path, params)
+        if ttl:
+            self._cache[key] = (time.monotonic(), data)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return data
+
+    async def _async_get(self, path: str, params: dict[str, Any] | None) -> Any:
+        auth = await self._async_valid_auth()
+        status, payload = await self._async_request(path, params, auth)
+        if status == 401:
+            # Only the first caller to see the rejected ticket logs in again;
+            # everyone else picks up the renewed (or in-flight) ticket.
+            if self._auth is auth:
+                auth = await self.async_login()
+            else:
+                auth = await self._async_valid_auth()
+            self._path_stats(path).retries += 1
+            status, payload = await self._async_request(path, params, auth)
+        if status != 200:
+            raise PMGApiError(f"GET {path} failed: {status} {payload}", status=status)
 
         return payload.get("data")
@@ -0,0 +1,276 @@
+"""Backfill of Home Assistant long-term statistics from PMG history."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import CONF_HOST, UnitOfInformation
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .api import PMGApiError
+from .const import (
+    ATTR_DAYS,
+    ATTR_ENTRY_ID,
+    DEFAULT_BACKFILL_DAYS,
+    DOMAIN,
+    SERVICE_BACKFILL,
+)
+from .stats import HOUR
+
+if TYPE_CHECKING:
+    from . import PMGDataUpdateCoordinator
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant before 2025.6
+    StatisticMeanType = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hours of /statistics/mailcount requested per page.
+MAILCOUNT_PAGE = 7 * 24
+# rrddata timeframes by the days they reach back, finest first.
+RRD_TIMEFRAMES = (("day", 1), ("week", 7), ("month", 30), ("year", 365))
+
+# Sensor keys filled from rrddata fields, with the unit of the field.
+RRD_SENSORS: dict[str, tuple[str, str | None]] = {
+    "loadavg_1m": ("loadavg", None),
+    "memory_used": ("memused", UnitOfInformation.BYTES),
+    "memory_total": ("memtotal", UnitOfInformation.BYTES),
+    "disk_used": ("rootused", UnitOfInformation.BYTES),
+    "disk_total": ("roottotal", UnitOfInformation.BYTES),
+}
+# Mail rate sensors filled from hourly /statistics/mailcount buckets.
+MAILCOUNT_SENSORS = {
+    "count_last_hour": "count",
+    "spamcount_in_last_hour": "spamcount_in",
+    "viruscount_in_last_hour": "viruscount_in",
+}
+
+Hours = dict[int, tuple[float, float, float]]
+
+BACKFILL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DAYS, default=DEFAULT_BACKFILL_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=365)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    if hass.services.has_service(DOMAIN, SERVICE_BACKFILL):
+        return
+
+    async def _async_handle_backfill(call: ServiceCall) -> ServiceResponse:
+        if "recorder" not in hass.config.components:
+            raise HomeAssistantError("The recorder is not running")
+        coordinators: dict[str, PMGDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+        if ATTR_ENTRY_ID in call.data:
+            entry_ids = [call.data[ATTR_ENTRY_ID]]
+        else:
+            entry_ids = list(coordinators)
+        imported: dict[str, int] = {}
+        for entry_id in entry_ids:
+            if (coordinator := coordinators.get(entry_id)) is None:
+                raise HomeAssistantError(f"Unknown PMG entry {entry_id}")
+            try:
+                imported.update(
+                    await async_backfill(hass, coordinator, call.data[ATTR_DAYS])
+                )
+            except PMGApiError as err:
+                raise HomeAssistantError(f"Backfill from PMG failed: {err}") from err
+        return {"imported": imported}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL,
+        _async_handle_backfill,
+        schema=BACKFILL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    if not hass.data.get(DOMAIN):
+        hass.services.async_remove(DOMAIN, SERVICE_BACKFILL)
+
+
+def hourly_rows(points: list[tuple[int, float]], step: int) -> Hours:
+    """Turn rrd points into hourly (mean, min, max) values.
+
+    Points finer than an hour are aggregated, coarser points repeat their
+    value for every hour they cover.
+    """
+    buckets: dict[int, list[float]] = {}
+    for time, value in points:
+        hour = time - time % HOUR
+        for offset in range(0, max(step, HOUR), HOUR):
+            buckets.setdefault(hour + offset, []).append(value)
+    return {
+        hour: (sum(values) / len(values), min(values), max(values))
+        for hour, values in buckets.items()
+    }
+
+
+async def async_backfill(
+    hass: HomeAssistant, coordinator: PMGDataUpdateCoordinator, days: int
+) -> dict[str, int]:
+    """Import up to days of history; returns the rows imported per entity."""
+    now = int(dt_util.utcnow().timestamp())
+    end = now - now % HOUR  # The running hour is compiled by the recorder.
+    start = end - days * 24 * HOUR
+    registry = er.async_get(hass)
+    entry = coordinator.entry
+    prefix = f"{entry.entry_id}_v2_{entry.data[CONF_HOST]}"
+
+    # unique_id -> (unit, hourly values)
+    series: dict[str, tuple[str | None, Hours]] = {}
+    if coordinator.mailcount is not None:
+        mail = await _async_mailcount(coordinator, start, end)
+        for key, counter in MAILCOUNT_SENSORS.items():
+            series[f"{prefix}_mailcount_{key}"] = (
+                None,
+                {hour: (counts[counter],) * 3 for hour, counts in mail.items()},
+            )
+    for node_name in coordinator.snapshot.nodes:
+        rrd = await _async_rrddata(coordinator, node_name, days, start, end)
+        for key, (field, unit) in RRD_SENSORS.items():
+            series[f"{prefix}_{node_name}_{key}"] = (unit, rrd.get(field, {}))
+
+    imported: dict[str, int] = {}
+    for unique_id, (unit, hours) in series.items():
+        entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+        if entity_id is None or not hours:
+            continue
+        state = hass.states.get(entity_id)
+        if state is not None and state.attributes.get("unit_of_measurement") != unit:
+            # Statistics are kept in the displayed unit; PMG reports native ones.
+            _LOGGER.debug("Not backfilling %s, its unit was changed", entity_id)
+            continue
+        imported[entity_id] = await _async_import(hass, entity_id, unit, hours, start)
+    return imported
+
+
+async def _async_mailcount(
+    coordinator: PMGDataUpdateCoordinator, start: int, end: int
+) -> dict[int, dict[str, float]]:
+    hours: dict[int, dict[str, float]] = {}
+    for page in range(start, end, MAILCOUNT_PAGE * HOUR):
+        page_end = min(page + MAILCOUNT_PAGE * HOUR, end)
+        rows = await coordinator.client.async_get(
+            "/statistics/mailcount",
+            params={"starttime": page, "endtime": page_end - 1, "timespan": HOUR},
+        )
+        for index, row in enumerate(rows or []):
+            hour = int(row.get("time", page + index * HOUR))
+            if start <= hour < end:
+                hours[hour] = {
+                    counter: float(row.get(counter) or 0)
+                    for counter in MAILCOUNT_SENSORS.values()
+                }
+    return hours
+
+
+async def _async_rrddata(
+    coordinator: PMGDataUpdateCoordinator,
+    node_name: str,
+    days: int,
+    start: int,
+    end: int,
+) -> dict[str, Hours]:
+    """Hourly values per rrd field, the finest timeframe winning."""
+    fields: dict[str, Hours] = {}
+    timeframes = []
+    for timeframe, reach in RRD_TIMEFRAMES:
+        timeframes.append(timeframe)
+        if reach >= days:
+            break
+    for timeframe in reversed(timeframes):
+        rows = await coordinator.client.async_get(
+            f"/nodes/{node_name}/rrddata",
+            params={"timeframe": timeframe, "cf": "AVERAGE"},
+        )
+        rows = [row for row in rows or [] if row.get("time") is not None]
+        times = sorted(int(row["time"]) for row in rows)
+        step = min((b - a for a, b in zip(times, times[1:]) if b > a), default=HOUR)
+        for field, _unit in RRD_SENSORS.values():
+            points = [
+                (int(row["time"]), float(row[field]))
+                for row in rows
+                if row.get(field) is not None
+            ]
+            hours = {
+                hour: value
+                for hour, value in hourly_rows(points, step).items()
+                if start <= hour < end
+            }
+            fields.setdefault(field, {}).update(hours)
+    return fields
+
+
+async def _async_import(
+    hass: HomeAssistant,
+    entity_id: str,
+    unit: str | None,
+    hours: Hours,
+    start: int,
+) -> int:
+    """Import the hours the recorder has no statistics for yet."""
+    existing = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        dt_util.utc_from_timestamp(start),
+        None,
+        {entity_id},
+        "hour",
+        None,
+        {"mean"},
+    )
+    known = {int(row["start"]) for row in existing.get(entity_id, [])}
+    rows = [
+        {
+            "start": dt_util.utc_from_timestamp(hour),
+            "mean": mean,
+            "min": minimum,
+            "max": maximum,
+        }
+        for hour, (mean, minimum, maximum) in sorted(hours.items())
+        if hour not in known
+    ]
+    if not rows:
+        return 0
+
+    metadata: dict[str, Any] = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": None,
+        "source": "recorder",
+        "statistic_id": entity_id,
+        "unit_of_measurement": unit,
+    }
+    if StatisticMeanType is not None:
+        metadata["mean_type"] = StatisticMeanType.ARITHMETIC
+    async_import_statistics(hass, metadata, rows)
+    _LOGGER.debug("Imported %s hourly statistics for %s", len(rows), entity_id)
+    return len(rows)
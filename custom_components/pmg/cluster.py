@@ -0,0 +1,117 @@
+"""Sharing of one API client between entries of the same PMG cluster."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import PMGApiClient, PMGApiError
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CLUSTERS = f"{DOMAIN}_clusters"
+CLUSTER_KEY_TIMEOUT = 10  # seconds
+# Share of a tier interval for which a shared client reuses fetched data.
+SHARED_TTL_FACTOR = 0.9
+
+
+@dataclass
+class PMGClusterHub:
+    """Client shared by every entry that resolved to the same cluster."""
+
+    key: str
+    client: PMGApiClient
+    # Connection settings the client was built from.
+    settings: tuple[Any, ...] = ()
+    close: Callable[[], Awaitable[Any]] | None = None
+    entries: set[str] = field(default_factory=set)
+
+    @property
+    def shared(self) -> bool:
+        return len(self.entries) > 1
+
+
+def _members(status: Any, field_name: str) -> list[str]:
+    return sorted(
+        str(node[field_name])
+        for node in status or []
+        if isinstance(node, dict) and node.get(field_name)
+    )
+
+
+async def async_cluster_key(client: PMGApiClient, host: str) -> str | None:
+    """Identify the cluster behind a client, or None if PMG cannot be asked.
+
+    Cluster members are identified by their certificate fingerprints. A
+    standalone node only matches entries for the same host, since node names
+    such as "pmg" are not unique across installations.
+    """
+    try:
+        async with asyncio.timeout(CLUSTER_KEY_TIMEOUT):
+            try:
+                status = await client.async_get("/config/cluster/status")
+            except PMGApiError as err:
+                if err.status is None:
+                    raise
+                status = None  # Not permitted for this user; use the node list.
+            members = _members(status, "fingerprint")
+            if members and len(members) == len(status):
+                return f"{client.user}|cluster|{','.join(members)}"
+            nodes = await client.async_get("/nodes")
+    except (PMGApiError, TimeoutError) as err:
+        _LOGGER.debug("Could not identify the PMG cluster of %s: %s", host, err)
+        return None
+    names = [
+        name
+        for node in nodes or []
+        if (name := node.get("node") or node.get("name"))
+    ]
+    return f"{client.user}|host|{host}|{','.join(sorted(names))}"
+
+
+@callback
+def async_acquire_hub(
+    hass: HomeAssistant,
+    key: str,
+    settings: tuple[Any, ...],
+    entry_id: str,
+    client: PMGApiClient,
+    close: Callable[[], Awaitable[Any]] | None,
+) -> PMGClusterHub:
+    """Join the hub for a cluster, creating it around this entry's client.
+
+    Only entries whose connection settings (TLS, rate limit, pool) match
+    share a client, so no entry runs on weaker settings than it asked for;
+    an entry reloaded with changed options gets a hub of its own.
+    """
+    hubs: dict[tuple[str, tuple[Any, ...]], PMGClusterHub] = hass.data.setdefault(
+        DATA_CLUSTERS, {}
+    )
+    hub = hubs.get((key, settings))
+    if hub is None:
+        if any(hub_key == key for hub_key, _ in hubs):
+            _LOGGER.debug(
+                "Not sharing the PMG client of %s, its connection settings differ",
+                key,
+            )
+        hub = hubs[key, settings] = PMGClusterHub(
+            key=key, client=client, settings=settings, close=close
+        )
+    hub.entries.add(entry_id)
+    return hub
+
+
+async def async_release_hub(
+    hass: HomeAssistant, hub: PMGClusterHub, entry_id: str
+) -> None:
+    hub.entries.discard(entry_id)
+    if hub.entries:
+        return
+    hass.data.get(DATA_CLUSTERS, {}).pop((hub.key, hub.settings), None)
+    if hub.close is not None:
+        await hub.close()
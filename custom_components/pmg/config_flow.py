@@ -20,18 +20,56 @@ from aiohttp import ClientError
 
 from .api import PMGApiClient, PMGApiError
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_CA_CERT,
+    CONF_DEDICATED_POOL,
+    CONF_DIAGNOSTIC_SENSORS,
+    CONF_FAST_STARTUP,
+    CONF_MAIL_SCAN_INTERVAL,
+    CONF_MAILCOUNT_TIMESPAN,
+    CONF_MAX_CONCURRENCY,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MESSAGE_TRACKER,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
     CONF_REALM,
     CONF_SCAN_INTERVAL,
+    CONF_SSL_FINGERPRINT,
     CONF_STATS_DAYS,
+    CONF_STATS_WINDOWS,
+    CONF_SYSLOG_PORT,
+    CONF_SYSTEM_SCAN_INTERVAL,
     CONF_VERIFY_SSL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DEDICATED_POOL,
+    DEFAULT_DIAGNOSTIC_SENSORS,
+    DEFAULT_FAST_STARTUP,
+    DEFAULT_MAIL_SCAN_INTERVAL,
+    DEFAULT_MAILCOUNT_TIMESPAN,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MESSAGE_TRACKER,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_STATS_DAYS,
+    DEFAULT_STATS_WINDOWS,
+    DEFAULT_SYSLOG_PORT,
+    DEFAULT_SYSTEM_SCAN_INTERVAL,
     DEFAULT_VERIFY_SSL,
     DOMAIN,
 )
 
 
+# SHA-256 certificate fingerprint, optionally colon separated.
+SSL_FINGERPRINT_RE = r"^[0-9A-Fa-f]{2}(:?[0-9A-Fa-f]{2}){31}$"
+# Comma separated window lengths in days, e.g. "7,30".
+STATS_WINDOWS_RE = r"^\s*(\d{1,3}\s*(,\s*\d{1,3}\s*)*)?$"
+
+
 async def _test_connection(hass: HomeAssistant, data: dict) -> None:
     session = async_get_clientsession(hass)
     client = PMGApiClient(
@@ -135,10 +173,107 @@ class PMGOptionsFlow(config_entries.OptionsFlow):
                         CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                     ),
                 ): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+                vol.Optional(
+                    CONF_MAIL_SCAN_INTERVAL,
+                    default=self.entry.options.get(
+                        CONF_MAIL_SCAN_INTERVAL,
+                        self.entry.options.get(
+                            CONF_SCAN_INTERVAL, DEFAULT_MAIL_SCAN_INTERVAL
+                        ),
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+                vol.Optional(
+                    CONF_SYSTEM_SCAN_INTERVAL,
+                    default=self.entry.options.get(
+                        CONF_SYSTEM_SCAN_INTERVAL, DEFAULT_SYSTEM_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING,
+                    default=self.entry.options.get(
+                        CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=self.entry.options.get(
+                        CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+                vol.Optional(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=self.entry.options.get(
+                        CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
                 vol.Optional(
                     CONF_STATS_DAYS,
                     default=self.entry.options.get(CONF_STATS_DAYS, DEFAULT_STATS_DAYS),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=365)),
+                vol.Optional(
+                    CONF_STATS_WINDOWS,
+                    default=self.entry.options.get(
+                        CONF_STATS_WINDOWS, DEFAULT_STATS_WINDOWS
+                    ),
+                ): vol.Match(STATS_WINDOWS_RE),
+                vol.Optional(
+                    CONF_MAX_CONCURRENCY,
+                    default=self.entry.options.get(
+                        CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+                vol.Optional(
+                    CONF_RATE_LIMIT,
+                    default=self.entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_RATE_BURST,
+                    default=self.entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                vol.Optional(
+                    CONF_SYSLOG_PORT,
+                    default=self.entry.options.get(CONF_SYSLOG_PORT, DEFAULT_SYSLOG_PORT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+                vol.Optional(
+                    CONF_MAILCOUNT_TIMESPAN,
+                    default=self.entry.options.get(
+                        CONF_MAILCOUNT_TIMESPAN, DEFAULT_MAILCOUNT_TIMESPAN
+                    ),
+                ): vol.All(
+                    vol.Coerce(int), vol.Any(0, vol.Range(min=3600, max=86400))
+                ),
+                vol.Optional(
+                    CONF_MESSAGE_TRACKER,
+                    default=self.entry.options.get(
+                        CONF_MESSAGE_TRACKER, DEFAULT_MESSAGE_TRACKER
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_FAST_STARTUP,
+                    default=self.entry.options.get(
+                        CONF_FAST_STARTUP, DEFAULT_FAST_STARTUP
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_DEDICATED_POOL,
+                    default=self.entry.options.get(
+                        CONF_DEDICATED_POOL, DEFAULT_DEDICATED_POOL
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_DIAGNOSTIC_SENSORS,
+                    default=self.entry.options.get(
+                        CONF_DIAGNOSTIC_SENSORS, DEFAULT_DIAGNOSTIC_SENSORS
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_CA_CERT,
+                    default=self.entry.options.get(CONF_CA_CERT, ""),
+                ): str,
+                vol.Optional(
+                    CONF_SSL_FINGERPRINT,
+                    default=self.entry.options.get(CONF_SSL_FINGERPRINT, ""),
+                ): vol.Any("", vol.Match(SSL_FINGERPRINT_RE)),
             }
         )
 
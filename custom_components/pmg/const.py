@@ -5,12 +5,124 @@ DOMAIN = "pmg"
 CONF_REALM = "realm"
 CONF_VERIFY_SSL = "verify_ssl"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_MAIL_SCAN_INTERVAL = "mail_scan_interval"
+CONF_SYSTEM_SCAN_INTERVAL = "system_scan_interval"
 CONF_STATS_DAYS = "stats_days"
+CONF_STATS_WINDOWS = "stats_windows"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_FAST_STARTUP = "fast_startup"
+CONF_DEDICATED_POOL = "dedicated_pool"
+CONF_CA_CERT = "ca_cert"
+CONF_SSL_FINGERPRINT = "ssl_fingerprint"
+CONF_DIAGNOSTIC_SENSORS = "diagnostic_sensors"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_BURST = "rate_burst"
+CONF_SYSLOG_PORT = "syslog_port"
+CONF_MESSAGE_TRACKER = "message_tracker"
+CONF_MAILCOUNT_TIMESPAN = "mailcount_timespan"
 
 DEFAULT_PORT = 8006
 DEFAULT_VERIFY_SSL = True
 DEFAULT_SCAN_INTERVAL = 300  # seconds
+DEFAULT_MAIL_SCAN_INTERVAL = 300  # seconds
+DEFAULT_SYSTEM_SCAN_INTERVAL = 3600  # seconds
 DEFAULT_STATS_DAYS = 1
+DEFAULT_STATS_WINDOWS = ""  # extra windows in days, e.g. "7,30"
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_FAST_STARTUP = True
+DEFAULT_DEDICATED_POOL = False
+DEFAULT_DIAGNOSTIC_SENSORS = False
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_MIN_SCAN_INTERVAL = 60  # seconds
+DEFAULT_MAX_SCAN_INTERVAL = 1800  # seconds
+DEFAULT_RATE_LIMIT = 0  # requests per second, 0 disables the limiter
+DEFAULT_RATE_BURST = 10
+DEFAULT_SYSLOG_PORT = 0  # 0 disables the syslog listener
+DEFAULT_MESSAGE_TRACKER = False
+DEFAULT_MAILCOUNT_TIMESPAN = 0  # seconds, 0 disables the mail rate sensors
+
+# Windows derived from /statistics/mailcount, in seconds.
+MAIL_RATE_WINDOWS: dict[str, int] = {"last_hour": 3600, "last_15min": 900}
+
+# Live counters are published at most this often.
+LIVE_UPDATE_DELAY = 1  # seconds
+
+# Refreshes of all PMG entries that may run at the same time.
+DOMAIN_MAX_REFRESHES = 4
+
+# Connection pool used when the entry gets its own aiohttp connector.
+POOL_KEEPALIVE_TIMEOUT = 120  # seconds
+POOL_DNS_CACHE_TTL = 300  # seconds
+
+# Service importing PMG history into long-term statistics.
+SERVICE_BACKFILL = "backfill_statistics"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_DAYS = "days"
+DEFAULT_BACKFILL_DAYS = 30
+
+# Refresh tiers, each polled at its own interval.
+TIER_NODES = "nodes"
+TIER_MAIL = "mail"
+TIER_SYSTEM = "system"
+
+# Sections are fetched and fail independently; each keeps its last good data.
+SECTION_NODES = "nodes"
+SECTION_UPDATES = "updates"
+SECTION_STATS = "stats"
+SECTION_QUARANTINE = "quarantine"
+SECTION_VERSION = "version"
+SECTION_TRACKER = "tracker"
+SECTION_MAILCOUNT = "mailcount"
+
+TIER_SECTIONS: dict[str, tuple[str, ...]] = {
+    TIER_NODES: (SECTION_NODES,),
+    TIER_MAIL: (
+        SECTION_STATS,
+        SECTION_QUARANTINE,
+        SECTION_TRACKER,
+        SECTION_MAILCOUNT,
+    ),
+    TIER_SYSTEM: (SECTION_VERSION, SECTION_UPDATES),
+}
+SECTION_TIERS: dict[str, str] = {
+    section: tier for tier, sections in TIER_SECTIONS.items() for section in sections
+}
+
+SECTION_TIMEOUTS: dict[str, float] = {  # seconds
+    SECTION_NODES: 20,
+    SECTION_UPDATES: 30,
+    SECTION_STATS: 60,
+    SECTION_QUARANTINE: 20,
+    SECTION_VERSION: 15,
+    SECTION_TRACKER: 30,
+    SECTION_MAILCOUNT: 20,
+}
+# A refresh publishes the sections that arrived within this many seconds;
+# slower ones publish on their own when they finish.
+SECTION_WAIT = 10  # seconds
+
+# Node endpoints tracked by the capability cache.
+ENDPOINT_APT_UPDATE = "apt/update"
+ENDPOINT_CLUSTER_STATUS = "config/cluster/status"
+ENDPOINT_TRACKER = "tracker"
+# Capability cache key for endpoints that are not tied to a node.
+CLUSTER = "cluster"
+
+# Short-lived response cache for reads that several consumers issue.
+CACHE_TTL: dict[str, float] = {
+    "/version": 300,
+}
+
+# Rate limiter tokens per request, by path prefix; other paths cost one.
+REQUEST_WEIGHTS: dict[str, float] = {
+    "/statistics/": 3,
+    "/nodes/{node}/apt/": 3,
+    "/nodes/{node}/tracker": 3,
+    "/quarantine/": 2,
+}
 
 ATTRIBUTION = "Data provided by Proxmox Mail Gateway"
 
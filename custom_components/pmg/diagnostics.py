@@ -27,6 +27,62 @@ async def async_get_config_entry_diagnostics(
             CONF_VERIFY_SSL: entry.options.get(CONF_VERIFY_SSL),
         },
         "data": coordinator.data,
+        "sections": {
+            section: {
+                "last_success": state.last_success.isoformat()
+                if state.last_success
+                else None,
+                "last_error": state.last_error,
+                "failures": state.failures,
+            }
+            for section, state in coordinator.sections.items()
+        },
+        "unsupported_endpoints": coordinator.capabilities.as_dict(),
+        "phase_timings_ms": coordinator.phase_timings,
+        "cluster": {
+            "shared_with_entries": len(coordinator.hub.entries) - 1
+            if coordinator.hub
+            else 0,
+        },
+        "scheduler": {
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "mail_interval": coordinator.adaptive.interval
+            if coordinator.adaptive
+            else None,
+            "backoff_failures": coordinator.backoff.failures
+            if coordinator.backoff
+            else None,
+            "slot": coordinator.scheduler.slot(entry.entry_id)
+            if coordinator.scheduler
+            else None,
+        },
+        "syslog": {
+            "server": coordinator.syslog.as_dict() if coordinator.syslog else None,
+            "sources": sorted(coordinator.syslog_sources),
+            "pending": coordinator.live.counts,
+        },
+        "tracker": {
+            "cursors": coordinator.tracker.cursors,
+            "entries_read": coordinator.tracker.entries_read,
+        }
+        if coordinator.tracker
+        else None,
+        "requests": {
+            "totals": coordinator.client.request_totals,
+            "paths": {
+                path: stats.as_dict()
+                for path, stats in coordinator.client.request_stats.items()
+            },
+            "cache": coordinator.client.cache_info,
+            "rate_limiter": coordinator.client.rate_limiter.as_dict()
+            if coordinator.client.rate_limiter
+            else None,
+            "endpoints": [
+                endpoint.as_dict() for endpoint in coordinator.client.endpoints
+            ],
+        },
     }
 
     return async_redact_data(data, TO_REDACT)
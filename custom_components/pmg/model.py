@@ -0,0 +1,173 @@
+"""Normalized snapshot of Proxmox Mail Gateway data."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .stats import flatten_stats
+
+
+@dataclass(frozen=True, slots=True)
+class PMGNodeSnapshot:
+    """Resource values of one node, derived from /nodes/{node}/status."""
+
+    cpu_usage: float | None = None
+    loadavg_1m: Any = None
+    memory_used: int | None = None
+    memory_total: int | None = None
+    disk_used: int | None = None
+    disk_total: int | None = None
+    uptime_hours: float | None = None
+
+    @classmethod
+    def from_status(cls, status: dict[str, Any]) -> PMGNodeSnapshot:
+        memory = status.get("memory") or {}
+        rootfs = status.get("rootfs") or {}
+        cpu = status.get("cpu")
+        uptime = status.get("uptime")
+        return cls(
+            cpu_usage=round(cpu * 100, 1) if cpu is not None else None,
+            loadavg_1m=(status.get("loadavg") or [None])[0],
+            memory_used=status.get("mem") or memory.get("used") or memory.get("usage"),
+            memory_total=status.get("maxmem")
+            or memory.get("total")
+            or memory.get("size"),
+            disk_used=status.get("disk") or rootfs.get("used"),
+            disk_total=status.get("maxdisk") or rootfs.get("total"),
+            uptime_hours=round(uptime / 3600, 2) if uptime is not None else None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PMGSnapshot:
+    """Everything the sensors read, computed once per refresh."""
+
+    version: str | None = None
+    nodes: dict[str, PMGNodeSnapshot] = field(default_factory=dict)
+    updates: dict[str, int | None] = field(default_factory=dict)
+    mail_stats: dict[str, float] = field(default_factory=dict)
+    # Additional statistics windows by length in days.
+    mail_stats_windows: dict[int, dict[str, float]] = field(default_factory=dict)
+    spam_count: int | None = None
+    virus_count: int | None = None
+    virus_avg_bytes: int | None = None
+    virus_bytes: int | None = None
+    tracker_rates: dict[str, float] = field(default_factory=dict)
+    mail_rates: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any] | None) -> PMGSnapshot:
+        data = data or {}
+        version = data.get("version") or {}
+        spam = _unwrap(data.get("spam_status"))
+        virus = _unwrap(data.get("virus_status"))
+        mbytes = virus.get("mbytes")
+        return cls(
+            version=version.get("version") or version.get("release"),
+            nodes={
+                node_name: PMGNodeSnapshot.from_status(status or {})
+                for node_name, status in (data.get("nodes") or {}).items()
+            },
+            updates={
+                node_name: _count_updates(updates)
+                for node_name, updates in (data.get("updates") or {}).items()
+            },
+            mail_stats=flatten_stats(data.get("mail_stats")),
+            mail_stats_windows={
+                int(days): flatten_stats(stats)
+                for days, stats in (data.get("mail_stats_windows") or {}).items()
+            },
+            spam_count=spam.get("count"),
+            virus_count=virus.get("count"),
+            virus_avg_bytes=virus.get("avgbytes"),
+            virus_bytes=round(float(mbytes) * 1024 * 1024) if mbytes is not None else None,
+            tracker_rates=dict(data.get("tracker_rates") or {}),
+            mail_rates=dict(data.get("mail_rates") or {}),
+        )
+
+
+def project_status(status: Any) -> dict[str, Any]:
+    """Reduce /nodes/{node}/status to the values PMGNodeSnapshot reads."""
+    if not isinstance(status, dict):
+        return {}
+    memory = status.get("memory") or {}
+    rootfs = status.get("rootfs") or {}
+    projected = {
+        "cpu": status.get("cpu"),
+        "loadavg": (status.get("loadavg") or [None])[:1],
+        "mem": status.get("mem") or memory.get("used") or memory.get("usage"),
+        "maxmem": status.get("maxmem") or memory.get("total") or memory.get("size"),
+        "disk": status.get("disk") or rootfs.get("used"),
+        "maxdisk": status.get("maxdisk") or rootfs.get("total"),
+        "uptime": status.get("uptime"),
+    }
+    return {key: value for key, value in projected.items() if value is not None}
+
+
+def project_updates(updates: Any) -> dict[str, Any] | None:
+    """Reduce an apt/update package list to its count and package names."""
+    if isinstance(updates, dict):
+        if "count" in updates:
+            return updates
+        updates = updates.get("data")
+    if not isinstance(updates, list):
+        return None
+    return {
+        "count": len(updates),
+        "packages": sorted(
+            str(package["Package"])
+            for package in updates
+            if isinstance(package, dict) and package.get("Package")
+        ),
+    }
+
+
+def project_quarantine(status: Any) -> dict[str, Any]:
+    """Reduce a quarantine status response to its count and size values."""
+    status = _unwrap(status)
+    return {
+        key: status[key]
+        for key in ("count", "avgbytes", "mbytes")
+        if status.get(key) is not None
+    }
+
+
+def project_version(version: Any) -> dict[str, Any]:
+    if not isinstance(version, dict):
+        return {}
+    return {
+        key: version[key] for key in ("version", "release") if version.get(key)
+    }
+
+
+def project_data(data: dict[str, Any] | None) -> dict[str, Any]:
+    """Project a complete coordinator payload, e.g. one restored from storage."""
+    data = dict(data or {})
+    if "nodes" in data:
+        data["nodes"] = {
+            node_name: project_status(status)
+            for node_name, status in (data["nodes"] or {}).items()
+        }
+    if "updates" in data:
+        data["updates"] = {
+            node_name: project_updates(updates)
+            for node_name, updates in (data["updates"] or {}).items()
+        }
+    for key in ("spam_status", "virus_status"):
+        if key in data:
+            data[key] = project_quarantine(data[key])
+    if "version" in data:
+        data["version"] = project_version(data["version"])
+    return data
+
+
+def _unwrap(status: Any) -> dict[str, Any]:
+    if isinstance(status, dict):
+        status = status.get("data") or status
+    return status if isinstance(status, dict) else {}
+
+
+def _count_updates(updates: Any) -> int | None:
+    projected = project_updates(updates)
+    return projected["count"] if projected is not None else None
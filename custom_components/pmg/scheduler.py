@@ -0,0 +1,121 @@
+"""Adaptive polling intervals for Proxmox Mail Gateway."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+# Smoothing of the per-counter rate used to recognise a burst.
+RATE_SMOOTHING = 0.3
+# A counter rising this many times faster than its average is a burst.
+BURST_FACTOR = 2.0
+SHORTEN_FACTOR = 0.5
+LENGTHEN_FACTOR = 1.5
+
+
+class PMGAdaptiveInterval:
+    """Poll interval that follows how fast mail and quarantine counters move.
+
+    Bursts halve the interval down to the minimum, counters that did not move
+    stretch it up to the maximum, anything in between drifts back to the
+    configured base interval.
+    """
+
+    def __init__(self, base: float, minimum: float, maximum: float) -> None:
+        self.minimum = min(minimum, base)
+        self.maximum = max(maximum, base)
+        self.base = base
+        self.interval = base
+        self._last: dict[str, float] = {}
+        self._last_time: float | None = None
+        self._rates: dict[str, float] = {}
+
+    def observe(self, now: float, counters: dict[str, float | None]) -> float:
+        """Feed the counters of a successful poll and return the new interval."""
+        counters = {key: value for key, value in counters.items() if value is not None}
+        last, last_time = self._last, self._last_time
+        self._last, self._last_time = counters, now
+        if last_time is None or now <= last_time:
+            return self.interval
+
+        minutes = (now - last_time) / 60
+        burst = False
+        flat = True
+        for key, value in counters.items():
+            if key not in last:
+                continue
+            # Window totals drop when a day leaves the window; only growth counts.
+            delta = max(value - last[key], 0)
+            rate = delta / minutes
+            average = self._rates.get(key)
+            if delta:
+                flat = False
+                if average is not None and rate > average * BURST_FACTOR:
+                    burst = True
+            self._rates[key] = (
+                rate
+                if average is None
+                else average + (rate - average) * RATE_SMOOTHING
+            )
+
+        if burst:
+            self.interval = max(self.minimum, self.interval * SHORTEN_FACTOR)
+        elif flat:
+            self.interval = min(self.maximum, self.interval * LENGTHEN_FACTOR)
+        else:
+            self.interval += (self.base - self.interval) / 2
+        return self.interval
+
+
+class PMGBackoff:
+    """Exponential backoff with jitter for a coordinator that cannot reach PMG."""
+
+    def __init__(self, base: float, maximum: float) -> None:
+        self.base = base
+        self.maximum = max(maximum, base)
+        self.failures = 0
+
+    def failed(self) -> float:
+        """Record a failure and return the delay until the next attempt."""
+        self.failures += 1
+        delay = min(self.maximum, self.base * 2**self.failures)
+        # Equal jitter: instances that failed together do not retry together.
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def reset(self) -> None:
+        self.failures = 0
+
+
+class PMGDomainScheduler:
+    """Spreads the refreshes of all PMG entries evenly over their interval.
+
+    Every entry gets its own phase within the interval, and a semaphore caps
+    how many entries of the domain refresh at the same time.
+    """
+
+    def __init__(self, max_refreshes: int) -> None:
+        self.semaphore = asyncio.Semaphore(max_refreshes)
+        self._entries: list[str] = []
+
+    def register(self, entry_id: str) -> None:
+        if entry_id not in self._entries:
+            self._entries.append(entry_id)
+
+    def unregister(self, entry_id: str) -> None:
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+
+    def slot(self, entry_id: str) -> tuple[int, int]:
+        return self._entries.index(entry_id), len(self._entries)
+
+    def delay(self, entry_id: str, interval: float, now: float) -> float:
+        """Seconds from now until the entry's next slot."""
+        if entry_id not in self._entries:
+            return interval
+        index, count = self.slot(entry_id)
+        delay = (interval * index / count - now) % interval
+        # A slot that is close by is skipped, so moving to the slot never
+        # polls faster than half the interval.
+        if delay < interval / 2:
+            delay += interval
+        return delay
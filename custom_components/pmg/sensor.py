@@ -11,12 +11,13 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    MATCH_ALL,
     EntityCategory,
     PERCENTAGE,
     UnitOfInformation,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -24,18 +25,47 @@ from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import CONF_HOST
 
 from . import PMGDataUpdateCoordinator
-from .const import ATTRIBUTION, DOMAIN
+from .const import (
+    ATTRIBUTION,
+    CONF_DIAGNOSTIC_SENSORS,
+    DEFAULT_DIAGNOSTIC_SENSORS,
+    DOMAIN,
+    SECTION_MAILCOUNT,
+    SECTION_NODES,
+    SECTION_QUARANTINE,
+    SECTION_STATS,
+    SECTION_TRACKER,
+    SECTION_UPDATES,
+    SECTION_VERSION,
+    TIER_MAIL,
+    TIER_NODES,
+    TIER_SYSTEM,
+)
+from .model import PMGNodeSnapshot, PMGSnapshot
+from .tracker import TRACKER_CATEGORIES
+
+
+@dataclass(frozen=True, kw_only=True)
+class PMGSensorEntityDescription(SensorEntityDescription):
+    """Sensor description with an optional deadband for state writes.
+
+    A new value is only written when it moves by more than the absolute
+    deadband or by more than deadband_percent of the last written value.
+    """
+
+    deadband: float | None = None
+    deadband_percent: float | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
-class PMGNodeSensorDescription(SensorEntityDescription):
-    value_fn: Callable[[dict[str, Any]], Any] | None = None
+class PMGNodeSensorDescription(PMGSensorEntityDescription):
+    value_fn: Callable[[PMGNodeSnapshot], Any] | None = None
     device_class: SensorDeviceClass | None = None
     state_class: SensorStateClass | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
-class PMGStatsSensorDescription(SensorEntityDescription):
+class PMGStatsSensorDescription(PMGSensorEntityDescription):
     key: str
     native_unit_of_measurement: str | None = None
     value_fn: Callable[[Any], Any] | None = None
@@ -43,20 +73,44 @@ class PMGStatsSensorDescription(SensorEntityDescription):
     state_class: SensorStateClass | None = None
 
 
+@dataclass(frozen=True, kw_only=True)
+class PMGDiagnosticSensorDescription(PMGSensorEntityDescription):
+    value_fn: Callable[[PMGDataUpdateCoordinator], Any]
+    attributes_fn: Callable[[PMGDataUpdateCoordinator], dict[str, Any]] | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class PMGQuarantineSensorDescription(PMGSensorEntityDescription):
+    value_fn: Callable[[PMGSnapshot], Any]
+
+
+@dataclass(frozen=True, kw_only=True)
+class PMGTrackerSensorDescription(PMGSensorEntityDescription):
+    category: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class PMGMailRateSensorDescription(PMGSensorEntityDescription):
+    counter: str
+    window: str
+    # Factor turning the window total into the sensor value, e.g. per hour.
+    scale: float = 1
+
+
 NODE_SENSORS: tuple[PMGNodeSensorDescription, ...] = (
     PMGNodeSensorDescription(
         key="cpu_usage",
         name="CPU Usage",
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: round((data.get("cpu") or 0) * 100, 1)
-        if data.get("cpu") is not None
-        else None,
+        value_fn=lambda node: node.cpu_usage,
+        deadband=0.5,
     ),
     PMGNodeSensorDescription(
         key="loadavg_1m",
         name="Load Average (1m)",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: (data.get("loadavg") or [None])[0],
+        value_fn=lambda node: node.loadavg_1m,
+        deadband=0.05,
     ),
     PMGNodeSensorDescription(
         key="memory_used",
@@ -64,9 +118,8 @@ NODE_SENSORS: tuple[PMGNodeSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfInformation.BYTES,
         device_class=SensorDeviceClass.DATA_SIZE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("mem")
-        or (data.get("memory") or {}).get("used")
-        or (data.get("memory") or {}).get("usage"),
+        value_fn=lambda node: node.memory_used,
+        deadband_percent=0.5,
     ),
     PMGNodeSensorDescription(
         key="memory_total",
@@ -74,9 +127,7 @@ NODE_SENSORS: tuple[PMGNodeSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfInformation.BYTES,
         device_class=SensorDeviceClass.DATA_SIZE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("maxmem")
-        or (data.get("memory") or {}).get("total")
-        or (data.get("memory") or {}).get("size"),
+        value_fn=lambda node: node.memory_total,
     ),
     PMGNodeSensorDescription(
         key="disk_used",
@@ -84,7 +135,8 @@ NODE_SENSORS: tuple[PMGNodeSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfInformation.BYTES,
         device_class=SensorDeviceClass.DATA_SIZE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("disk") or (data.get("rootfs") or {}).get("used"),
+        value_fn=lambda node: node.disk_used,
+        deadband_percent=0.1,
     ),
     PMGNodeSensorDescription(
         key="disk_total",
@@ -92,8 +144,7 @@ NODE_SENSORS: tuple[PMGNodeSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfInformation.BYTES,
         device_class=SensorDeviceClass.DATA_SIZE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("maxdisk")
-        or (data.get("rootfs") or {}).get("total"),
+        value_fn=lambda node: node.disk_total,
     ),
     PMGNodeSensorDescription(
         key="uptime",
@@ -101,9 +152,7 @@ NODE_SENSORS: tuple[PMGNodeSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.HOURS,
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: round((data.get("uptime") or 0) / 3600, 2)
-        if data.get("uptime") is not None
-        else None,
+        value_fn=lambda node: node.uptime_hours,
     ),
 )
 
@@ -179,38 +228,138 @@ STATS_SENSORS: tuple[PMGStatsSensorDescription, ...] = (
     ),
 )
 
-UPDATE_SENSORS: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
+UPDATE_SENSORS: tuple[PMGSensorEntityDescription, ...] = (
+    PMGSensorEntityDescription(
         key="updates_available",
         name="Updates Available",
         state_class=SensorStateClass.MEASUREMENT,
     ),
 )
 
-QUARANTINE_SENSORS: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
+QUARANTINE_SENSORS: tuple[PMGQuarantineSensorDescription, ...] = (
+    PMGQuarantineSensorDescription(
         key="spam_quarantine_count",
         name="Spam Quarantine Count",
         state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda snapshot: snapshot.spam_count,
     ),
-    SensorEntityDescription(
+    PMGQuarantineSensorDescription(
         key="virus_quarantine_count",
         name="Virus Quarantine Count",
         state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda snapshot: snapshot.virus_count,
     ),
-    SensorEntityDescription(
+    PMGQuarantineSensorDescription(
         key="virus_quarantine_avg_bytes",
         name="Virus Quarantine Avg Size",
         native_unit_of_measurement=UnitOfInformation.BYTES,
         device_class=SensorDeviceClass.DATA_SIZE,
         state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda snapshot: snapshot.virus_avg_bytes,
     ),
-    SensorEntityDescription(
+    PMGQuarantineSensorDescription(
         key="virus_quarantine_mbytes",
         name="Virus Quarantine Size",
         native_unit_of_measurement=UnitOfInformation.BYTES,
         device_class=SensorDeviceClass.DATA_SIZE,
         state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda snapshot: snapshot.virus_bytes,
+    ),
+)
+
+
+TRACKER_SENSORS: tuple[PMGTrackerSensorDescription, ...] = tuple(
+    PMGTrackerSensorDescription(
+        key=f"tracker_{category}_rate",
+        name=f"{category.capitalize()} Rate",
+        category=category,
+        native_unit_of_measurement="mails/min",
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+    for category in TRACKER_CATEGORIES
+)
+
+
+MAIL_RATE_SENSORS: tuple[PMGMailRateSensorDescription, ...] = tuple(
+    description
+    for counter, label in (
+        ("count", "Mails"),
+        ("spamcount_in", "Spam"),
+        ("viruscount_in", "Virus"),
+    )
+    for description in (
+        PMGMailRateSensorDescription(
+            key=f"{counter}_last_hour",
+            name=f"{label} Last Hour",
+            counter=counter,
+            window="last_hour",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        PMGMailRateSensorDescription(
+            key=f"{counter}_last_15min",
+            name=f"{label} Last 15 min",
+            counter=counter,
+            window="last_15min",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        PMGMailRateSensorDescription(
+            key=f"{counter}_rate",
+            name=f"{label} Rate",
+            counter=counter,
+            window="last_15min",
+            scale=4,
+            native_unit_of_measurement="mails/h",
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+    )
+)
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+DIAGNOSTIC_SENSORS: tuple[PMGDiagnosticSensorDescription, ...] = (
+    PMGDiagnosticSensorDescription(
+        key="refresh_duration",
+        name="Refresh Duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.phase_timings.get("total"),
+        attributes_fn=lambda coordinator: dict(coordinator.phase_timings),
+    ),
+    PMGDiagnosticSensorDescription(
+        key="api_latency_p95",
+        name="API Latency p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _milliseconds(
+            coordinator.client.latency_percentile(0.95)
+        ),
+        attributes_fn=lambda coordinator: {
+            path: stats.as_dict()
+            for path, stats in coordinator.client.request_stats.items()
+        },
+    ),
+    PMGDiagnosticSensorDescription(
+        key="api_requests",
+        name="API Requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.request_totals["requests"],
+    ),
+    PMGDiagnosticSensorDescription(
+        key="api_errors",
+        name="API Errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.request_totals["errors"],
+    ),
+    PMGDiagnosticSensorDescription(
+        key="api_relogins",
+        name="API Re-logins",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.request_totals["relogins"],
     ),
 )
 
@@ -224,13 +373,14 @@ async def async_setup_entry(
 
     entities: list[SensorEntity] = []
 
-    nodes = coordinator.data.get("nodes", {}) if coordinator.data else {}
+    nodes = coordinator.snapshot.nodes
     for node_name in nodes:
         for description in NODE_SENSORS:
             entities.append(PMGNodeSensor(coordinator, entry, node_name, description))
 
-    for description in STATS_SENSORS:
-        entities.append(PMGMailStatsSensor(coordinator, entry, description))
+    for days in (None, *coordinator.stats_windows):
+        for description in STATS_SENSORS:
+            entities.append(PMGMailStatsSensor(coordinator, entry, description, days))
 
     for description in UPDATE_SENSORS:
         for node_name in nodes:
@@ -239,14 +389,80 @@ async def async_setup_entry(
     for description in QUARANTINE_SENSORS:
         entities.append(PMGQuarantineSensor(coordinator, entry, description))
 
+    if coordinator.mailcount is not None:
+        for description in MAIL_RATE_SENSORS:
+            entities.append(PMGMailRateSensor(coordinator, entry, description))
+
+    if coordinator.tracker is not None:
+        for description in TRACKER_SENSORS:
+            entities.append(PMGTrackerSensor(coordinator, entry, description))
+
     entities.append(PMGVersionSensor(coordinator, entry))
 
+    if entry.options.get(CONF_DIAGNOSTIC_SENSORS, DEFAULT_DIAGNOSTIC_SENSORS):
+        for description in DIAGNOSTIC_SENSORS:
+            entities.append(PMGDiagnosticSensor(coordinator, entry, description))
+
     async_add_entities(entities)
 
 
-class PMGNodeSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity):
+class _PMGSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity):
+    _section: str
+    _written: tuple[bool, Any, dict[str, Any] | None] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability, attributes or the value moved."""
+        state = (self.available, self.native_value, self.extra_state_attributes)
+        if self._written is not None and self._unchanged(self._written, state):
+            return
+        self._written = state
+        self.async_write_ha_state()
+
+    def _unchanged(
+        self,
+        old: tuple[bool, Any, dict[str, Any] | None],
+        new: tuple[bool, Any, dict[str, Any] | None],
+    ) -> bool:
+        if old[0] != new[0] or old[2] != new[2]:
+            return False
+        if old[1] == new[1]:
+            return True
+        description = self.entity_description
+        if not isinstance(description, PMGSensorEntityDescription) or (
+            description.deadband is None and description.deadband_percent is None
+        ):
+            return False
+        try:
+            previous, current = float(old[1]), float(new[1])
+        except (TypeError, ValueError):
+            return False
+        delta = abs(current - previous)
+        if description.deadband is not None and delta > description.deadband:
+            return False
+        if (
+            description.deadband_percent is not None
+            and delta > abs(previous) * description.deadband_percent / 100
+        ):
+            return False
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        attributes: dict[str, Any] = {}
+        if self.coordinator.restored:
+            attributes["restored"] = True
+        if self.coordinator.sections[self._section].stale:
+            # The value is the last one PMG delivered for this section.
+            attributes["stale"] = True
+        return attributes or None
+
+
+class PMGNodeSensor(_PMGSensor):
     """Node sensor."""
 
+    _section = SECTION_NODES
+
     def __init__(
         self,
         coordinator: PMGDataUpdateCoordinator,
@@ -254,7 +470,7 @@ class PMGNodeSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity):
         node_name: str,
         description: PMGNodeSensorDescription,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=TIER_NODES)
         self.entity_description = description
         self._node_name = node_name
         self._attr_unique_id = (
@@ -274,37 +490,48 @@ class PMGNodeSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity):
 
     @property
     def native_value(self):
-        node_data = (self.coordinator.data or {}).get("nodes", {}).get(self._node_name, {})
+        node = self.coordinator.snapshot.nodes.get(self._node_name)
         value_fn = self.entity_description.value_fn
-        if value_fn is None:
+        if node is None or value_fn is None:
             return None
-        return value_fn(node_data)
+        return value_fn(node)
 
 
-class PMGMailStatsSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity):
+class PMGMailStatsSensor(_PMGSensor):
     """Mail statistics sensor."""
 
+    _section = SECTION_STATS
+
     def __init__(
         self,
         coordinator: PMGDataUpdateCoordinator,
         entry: ConfigEntry,
         description: PMGStatsSensorDescription,
+        days: int | None = None,
     ) -> None:
-        super().__init__(coordinator)
-        self.entity_description = SensorEntityDescription(
+        super().__init__(coordinator, context=TIER_MAIL)
+        self.entity_description = PMGSensorEntityDescription(
             key=description.key,
             name=description.name,
             native_unit_of_measurement=description.native_unit_of_measurement,
             device_class=description.device_class,
             state_class=description.state_class,
+            deadband=description.deadband,
+            deadband_percent=description.deadband_percent,
         )
         self._key = description.key
         self._value_fn = description.value_fn
+        self._days = days
+        suffix = f"_{days}d" if days is not None else ""
         self._attr_unique_id = (
-            f"{entry.entry_id}_v2_{entry.data[CONF_HOST]}_mail_{description.key}"
+            f"{entry.entry_id}_v2_{entry.data[CONF_HOST]}_mail_{description.key}{suffix}"
+        )
+        self._attr_name = (
+            f"{description.name} ({days}d)" if days is not None else description.name
+        )
+        self._attr_suggested_object_id = (
+            f"pmg_{entry.data[CONF_HOST]}_{description.key}{suffix}"
         )
-        self._attr_name = description.name
-        self._attr_suggested_object_id = f"pmg_{entry.data[CONF_HOST]}_{description.key}"
         self._attr_attribution = ATTRIBUTION
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.data[CONF_HOST])},
@@ -315,21 +542,27 @@ class PMGMailStatsSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEnti
 
     @property
     def native_value(self):
-        stats = (self.coordinator.data or {}).get("mail_stats") or {}
-        value = _extract_stat(stats, self._key)
+        snapshot = self.coordinator.snapshot
+        stats = (
+            snapshot.mail_stats
+            if self._days is None
+            else snapshot.mail_stats_windows.get(self._days, {})
+        )
+        value = stats.get(self._key)
         if self._value_fn is not None:
             return self._value_fn(value)
         return value
 
 
-class PMGVersionSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity):
+class PMGVersionSensor(_PMGSensor):
     """Version sensor."""
 
+    _section = SECTION_VERSION
     _attr_name = "PMG Version"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, coordinator: PMGDataUpdateCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=TIER_SYSTEM)
         self._attr_unique_id = f"{entry.entry_id}_v2_{entry.data[CONF_HOST]}_version"
         self._attr_attribution = ATTRIBUTION
         self._attr_device_info = DeviceInfo(
@@ -341,22 +574,22 @@ class PMGVersionSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity
 
     @property
     def native_value(self):
-        version = (self.coordinator.data or {}).get("version") or {}
-        return version.get("version") or version.get("release")
+        return self.coordinator.snapshot.version
 
 
-class PMGQuarantineSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity):
+class PMGQuarantineSensor(_PMGSensor):
     """Quarantine sensors."""
 
+    _section = SECTION_QUARANTINE
+
     def __init__(
         self,
         coordinator: PMGDataUpdateCoordinator,
         entry: ConfigEntry,
-        description: SensorEntityDescription,
+        description: PMGQuarantineSensorDescription,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=TIER_MAIL)
         self.entity_description = description
-        self._key = description.key
         self._attr_unique_id = (
             f"{entry.entry_id}_v2_{entry.data[CONF_HOST]}_quarantine_{description.key}"
         )
@@ -374,46 +607,93 @@ class PMGQuarantineSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEnt
 
     @property
     def native_value(self):
-        if self._key == "spam_quarantine_count":
-            data = (self.coordinator.data or {}).get("spam_status") or {}
-            if isinstance(data, dict):
-                data = data.get("data") or data
-            return data.get("count") if isinstance(data, dict) else None
-
-        if self._key == "virus_quarantine_count":
-            data = (self.coordinator.data or {}).get("virus_status") or {}
-            if isinstance(data, dict):
-                data = data.get("data") or data
-            return data.get("count") if isinstance(data, dict) else None
-
-        if self._key == "virus_quarantine_avg_bytes":
-            data = (self.coordinator.data or {}).get("virus_status") or {}
-            if isinstance(data, dict):
-                data = data.get("data") or data
-            return data.get("avgbytes") if isinstance(data, dict) else None
-
-        if self._key == "virus_quarantine_mbytes":
-            data = (self.coordinator.data or {}).get("virus_status") or {}
-            if isinstance(data, dict):
-                data = data.get("data") or data
-            if isinstance(data, dict) and data.get("mbytes") is not None:
-                return round(float(data.get("mbytes")) * 1024 * 1024)
-            return None
+        return self.entity_description.value_fn(self.coordinator.snapshot)
 
-        return None
 
+class PMGMailRateSensor(_PMGSensor):
+    """Mail counters of a recent window, from /statistics/mailcount."""
 
-class PMGNodeUpdateSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity):
+    _section = SECTION_MAILCOUNT
+
+    def __init__(
+        self,
+        coordinator: PMGDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: PMGMailRateSensorDescription,
+    ) -> None:
+        super().__init__(coordinator, context=TIER_MAIL)
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{entry.entry_id}_v2_{entry.data[CONF_HOST]}_mailcount_{description.key}"
+        )
+        self._attr_name = description.name
+        self._attr_suggested_object_id = (
+            f"pmg_{entry.data[CONF_HOST]}_{description.key}"
+        )
+        self._attr_attribution = ATTRIBUTION
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.data[CONF_HOST])},
+            name=entry.data[CONF_HOST],
+            manufacturer="Proxmox",
+            model="Proxmox Mail Gateway",
+        )
+
+    @property
+    def native_value(self):
+        description = self.entity_description
+        window = self.coordinator.snapshot.mail_rates.get(description.window) or {}
+        value = window.get(description.counter)
+        return round(value * description.scale, 1) if value is not None else None
+
+
+class PMGTrackerSensor(_PMGSensor):
+    """Mail rates from the message tracker."""
+
+    _section = SECTION_TRACKER
+
+    def __init__(
+        self,
+        coordinator: PMGDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: PMGTrackerSensorDescription,
+    ) -> None:
+        super().__init__(coordinator, context=TIER_MAIL)
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{entry.entry_id}_v2_{entry.data[CONF_HOST]}_{description.key}"
+        )
+        self._attr_name = description.name
+        self._attr_suggested_object_id = (
+            f"pmg_{entry.data[CONF_HOST]}_{description.key}"
+        )
+        self._attr_attribution = ATTRIBUTION
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.data[CONF_HOST])},
+            name=entry.data[CONF_HOST],
+            manufacturer="Proxmox",
+            model="Proxmox Mail Gateway",
+        )
+
+    @property
+    def native_value(self):
+        return self.coordinator.snapshot.tracker_rates.get(
+            self.entity_description.category
+        )
+
+
+class PMGNodeUpdateSensor(_PMGSensor):
     """Node updates sensor."""
 
+    _section = SECTION_UPDATES
+
     def __init__(
         self,
         coordinator: PMGDataUpdateCoordinator,
         entry: ConfigEntry,
         node_name: str,
-        description: SensorEntityDescription,
+        description: PMGSensorEntityDescription,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=TIER_SYSTEM)
         self.entity_description = description
         self._node_name = node_name
         self._attr_unique_id = (
@@ -433,37 +713,48 @@ class PMGNodeUpdateSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEnt
 
     @property
     def native_value(self):
-        updates = (self.coordinator.data or {}).get("updates", {}).get(self._node_name)
-        if updates is None:
-            return None
-        if isinstance(updates, dict):
-            updates = updates.get("data")
-        if isinstance(updates, list):
-            return len(updates)
-        return None
-
-
-def _extract_stat(stats: Any, key: str) -> Any:
-    if isinstance(stats, dict):
-        if key in stats:
-            return stats[key]
-        data = stats.get("data")
-        if isinstance(data, dict):
-            return data.get(key)
-        if isinstance(data, list):
-            return _sum_stat_list(data, key)
-
-    if isinstance(stats, list):
-        return _sum_stat_list(stats, key)
-
-    return None
-
-
-def _sum_stat_list(items: list[dict[str, Any]], key: str) -> Any:
-    total = 0
-    found = False
-    for item in items:
-        if key in item and isinstance(item[key], (int, float)):
-            total += item[key]
-            found = True
-    return total if found else None
+        return self.coordinator.snapshot.updates.get(self._node_name)
+
+
+class PMGDiagnosticSensor(CoordinatorEntity[PMGDataUpdateCoordinator], SensorEntity):
+    """Request and refresh timing sensor."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Per-path details change on every refresh; keep them out of the recorder.
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    def __init__(
+        self,
+        coordinator: PMGDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: PMGDiagnosticSensorDescription,
+    ) -> None:
+        # No tier context: every refresh changes the counters.
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{entry.entry_id}_v2_{entry.data[CONF_HOST]}_diagnostic_{description.key}"
+        )
+        self._attr_name = description.name
+        self._attr_suggested_object_id = f"pmg_{entry.data[CONF_HOST]}_{description.key}"
+        self._attr_attribution = ATTRIBUTION
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.data[CONF_HOST])},
+            name=entry.data[CONF_HOST],
+            manufacturer="Proxmox",
+            model="Proxmox Mail Gateway",
+        )
+
+    @property
+    def available(self) -> bool:
+        # Failed refreshes are what these sensors are meant to show.
+        return True
+
+    @property
+    def native_value(self):
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        attributes_fn = self.entity_description.attributes_fn
+        return attributes_fn(self.coordinator) if attributes_fn is not None else None
@@ -0,0 +1,289 @@
+"""Mail statistics helpers for Proxmox Mail Gateway."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+import math
+from typing import Any, Iterable
+
+DAY = 86400
+HOUR = 3600
+
+# Statistics for a finished day may still receive mails that were in the
+# filter at midnight, so a day is only cached once this grace has passed.
+CLOSED_DAY_GRACE = 600  # seconds
+
+# /statistics/mail reports these as averages; everything else is a counter.
+AVERAGE_KEYS = ("avptime",)
+WEIGHT_KEY = "count"
+
+# Counters of a /statistics/mailcount bucket.
+MAILCOUNT_KEYS = (
+    "count",
+    "count_in",
+    "count_out",
+    "spamcount_in",
+    "spamcount_out",
+    "viruscount_in",
+    "viruscount_out",
+    "bounces_in",
+    "bounces_out",
+)
+# Longest window derived from the mailcount series.
+MAILCOUNT_LOOKBACK = HOUR
+
+
+def flatten_stats(stats: Any) -> dict[str, float]:
+    """Reduce a /statistics/mail response to a flat dict of numeric values."""
+    if isinstance(stats, dict):
+        data = stats.get("data")
+        if isinstance(data, (dict, list)):
+            return flatten_stats(data)
+        return {
+            key: value
+            for key, value in stats.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+    if isinstance(stats, list):
+        return combine_stats(flatten_stats(item) for item in stats)
+    return {}
+
+
+def combine_stats(buckets: Iterable[dict[str, float]]) -> dict[str, float]:
+    """Sum counter buckets, weighting averages by the mail count."""
+    totals: dict[str, float] = {}
+    weighted: dict[str, float] = {}
+    for bucket in buckets:
+        weight = bucket.get(WEIGHT_KEY) or 0
+        for key, value in bucket.items():
+            if key in AVERAGE_KEYS:
+                weighted[key] = weighted.get(key, 0) + value * weight
+            else:
+                totals[key] = totals.get(key, 0) + value
+
+    count = totals.get(WEIGHT_KEY) or 0
+    for key, value in weighted.items():
+        totals[key] = value / count if count else 0
+    return totals
+
+
+def window_totals(
+    buckets: list[dict[str, float]], windows: Iterable[int]
+) -> dict[int, dict[str, float]]:
+    """Totals of the last n buckets for every window n, like combine_stats.
+
+    One pass builds prefix sums over the buckets (averages as count weighted
+    sums), after which each window is the difference of two prefixes.
+    """
+    prefixes: list[dict[str, float]] = [{}]
+    running: dict[str, float] = {}
+    for bucket in buckets:
+        weight = bucket.get(WEIGHT_KEY) or 0
+        for key, value in bucket.items():
+            running[key] = running.get(key, 0) + (
+                value * weight if key in AVERAGE_KEYS else value
+            )
+        prefixes.append(dict(running))
+
+    end = prefixes[-1]
+    totals: dict[int, dict[str, float]] = {}
+    for window in windows:
+        start = prefixes[max(len(buckets) - window, 0)]
+        window_total = {key: value - start.get(key, 0) for key, value in end.items()}
+        count = window_total.get(WEIGHT_KEY) or 0
+        for key in AVERAGE_KEYS:
+            if key in window_total:
+                window_total[key] = window_total[key] / count if count else 0
+        totals[window] = window_total
+    return totals
+
+
+def parse_windows(value: str | None) -> list[int]:
+    """Parse a comma separated list of window lengths in days."""
+    days = {int(part) for part in (value or "").replace(" ", "").split(",") if part}
+    return sorted(window for window in days if 0 < window <= 365)
+
+
+class PMGMailStatsCache:
+    """Per-day /statistics/mail buckets for days that can no longer change."""
+
+    def __init__(self, days: dict[int, dict[str, float]] | None = None) -> None:
+        self._days: dict[int, dict[str, float]] = dict(days or {})
+
+    @property
+    def days(self) -> dict[int, dict[str, float]]:
+        return self._days
+
+    def missing(self, days: Iterable[int]) -> list[int]:
+        return [day for day in days if day not in self._days]
+
+    def set(self, day: int, stats: dict[str, float]) -> None:
+        self._days[day] = stats
+
+    def prune(self, oldest: int) -> None:
+        for day in [day for day in self._days if day < oldest]:
+            del self._days[day]
+
+    def windows(
+        self,
+        days: list[int],
+        open_buckets: dict[int, dict[str, float]],
+        windows: Iterable[int],
+    ) -> dict[int, dict[str, float]]:
+        """Totals of the last n of the given days for every window n."""
+        return window_totals(
+            [open_buckets.get(day) or self._days.get(day) or {} for day in days],
+            windows,
+        )
+
+
+class PMGLiveStats:
+    """Mail counters from log events since the last /statistics/mail poll.
+
+    A poll checkpoints the counters when it starts and discards that part
+    once it succeeded; events that arrived meanwhile stay on top of the
+    new totals.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[str, float] = {}
+        self.averages: dict[str, tuple[float, int]] = {}
+
+    @property
+    def empty(self) -> bool:
+        return not self.counts and not self.averages
+
+    def add(self, deltas: dict[str, float]) -> None:
+        for key, value in deltas.items():
+            if key in AVERAGE_KEYS:
+                total, samples = self.averages.get(key, (0.0, 0))
+                self.averages[key] = (total + value, samples + 1)
+            else:
+                self.counts[key] = self.counts.get(key, 0) + value
+
+    def checkpoint(self) -> tuple[dict[str, float], dict[str, tuple[float, int]]]:
+        return dict(self.counts), dict(self.averages)
+
+    def discard(
+        self, checkpoint: tuple[dict[str, float], dict[str, tuple[float, int]]]
+    ) -> None:
+        counts, averages = checkpoint
+        for key, value in counts.items():
+            remaining = self.counts.get(key, 0) - value
+            if remaining > 0:
+                self.counts[key] = remaining
+            else:
+                self.counts.pop(key, None)
+        for key, (total, samples) in averages.items():
+            current_total, current_samples = self.averages.get(key, (0.0, 0))
+            if current_samples > samples:
+                self.averages[key] = (current_total - total, current_samples - samples)
+            else:
+                self.averages.pop(key, None)
+
+    def apply(self, polled: dict[str, float]) -> dict[str, float]:
+        """Polled window totals plus the events seen since."""
+        if not self.counts:
+            return polled
+        bucket = dict(self.counts)
+        for key in AVERAGE_KEYS:
+            if key in self.averages:
+                total, samples = self.averages[key]
+                bucket[key] = total / samples
+            elif key in polled:
+                bucket[key] = polled[key]
+        return combine_stats([polled, bucket])
+
+
+class PMGMailCountSeries:
+    """Rolling /statistics/mailcount buckets, one array per counter.
+
+    The buckets form a ring just long enough for the longest derived window.
+    Each poll only asks for the bucket that was still open last time and the
+    ones after it. The open bucket is sampled on every poll, so windows
+    shorter than a bucket are derived from how it grew; closed buckets are
+    assumed to have filled evenly.
+    """
+
+    def __init__(self, timespan: int) -> None:
+        self.timespan = timespan
+        self._size = math.ceil(MAILCOUNT_LOOKBACK / timespan) + 1
+        self._starts = array("q", [-1] * self._size)
+        self._counts = {key: array("d", bytes(8 * self._size)) for key in MAILCOUNT_KEYS}
+        self._open: int | None = None
+        # (poll time, counters of the open bucket at that time)
+        self._sample_times: list[float] = []
+        self._samples: list[dict[str, float]] = []
+
+    def params(self, now: int) -> dict[str, int]:
+        start = now - now % self.timespan
+        # The ring holds no more than this, however long PMG was unreachable.
+        oldest = start - (self._size - 1) * self.timespan
+        if self._open is None:
+            start = oldest
+        else:
+            start = max(min(start, self._open), oldest)
+        return {"starttime": start, "endtime": now, "timespan": self.timespan}
+
+    def ingest(self, rows: Any, now: int) -> None:
+        start = self.params(now)["starttime"]
+        for index, row in enumerate(rows if isinstance(rows, list) else ()):
+            if not isinstance(row, dict):
+                continue
+            bucket = int(row.get("time", start + index * self.timespan))
+            slot = bucket // self.timespan % self._size
+            self._starts[slot] = bucket
+            for key in MAILCOUNT_KEYS:
+                self._counts[key][slot] = float(row.get(key) or 0)
+
+        open_start = now - now % self.timespan
+        if self._open != open_start:
+            self._open = open_start
+            self._sample_times.clear()
+            self._samples.clear()
+        slot = open_start // self.timespan % self._size
+        if self._starts[slot] == open_start:
+            self._sample_times.append(now)
+            self._samples.append(
+                {key: values[slot] for key, values in self._counts.items()}
+            )
+
+    def window(self, seconds: float, now: float) -> dict[str, float]:
+        """Counter totals of the last seconds up to now."""
+        start = now - seconds
+        totals = dict.fromkeys(MAILCOUNT_KEYS, 0.0)
+        for slot, bucket in enumerate(self._starts):
+            if bucket < 0 or bucket + self.timespan <= start or bucket >= now:
+                continue
+            if bucket == self._open:
+                since = max(bucket, start)
+                for key in MAILCOUNT_KEYS:
+                    totals[key] += self._counts[key][slot] - self._open_value(key, since)
+                continue
+            share = (min(bucket + self.timespan, now) - max(bucket, start)) / self.timespan
+            for key in MAILCOUNT_KEYS:
+                totals[key] += self._counts[key][slot] * share
+        return totals
+
+    def _open_value(self, key: str, time: float) -> float:
+        """Counter of the open bucket at a past time, between two samples."""
+        index = bisect_right(self._sample_times, time)
+        if index == len(self._samples):
+            return self._samples[-1][key] if self._samples else 0.0
+        after_time, after = self._sample_times[index], self._samples[index][key]
+        if index == 0:
+            before_time, before = float(self._open or 0), 0.0
+        else:
+            before_time, before = self._sample_times[index - 1], self._samples[index - 1][key]
+        if after_time <= before_time:
+            return after
+        return before + (after - before) * (time - before_time) / (after_time - before_time)
+
+
+def split_window(now: int, stats_days: int) -> tuple[list[int], list[int]]:
+    """Return the closed and open UTC day starts of a window ending today."""
+    today = now - now % DAY
+    window = [today - DAY * offset for offset in range(stats_days - 1, -1, -1)]
+    closed = [day for day in window if day + DAY + CLOSED_DAY_GRACE <= now]
+    return closed, window[len(closed) :]
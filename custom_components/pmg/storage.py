@@ -0,0 +1,96 @@
+"""Persistent cache for Proxmox Mail Gateway."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STORAGE = f"{DOMAIN}_storage"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds
+MAX_STORED_DAYS = 366
+MAX_SNAPSHOT_BYTES = 256 * 1024
+
+
+class PMGStorage:
+    """Per-entry store for closed mail statistics days and the last snapshot."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self.stats_days: dict[int, dict[str, float]] = {}
+        self.snapshot: dict[str, Any] | None = None
+        # Identity of the PMG cluster, so setup can share a client offline.
+        self.cluster_key: str | None = None
+        # Message tracker position per node.
+        self.tracker_cursors: dict[str, dict[str, Any]] = {}
+        self._pending = False
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        self.stats_days = {
+            int(day): stats for day, stats in (data.get("stats_days") or {}).items()
+        }
+        self.snapshot = data.get("snapshot")
+        self.cluster_key = data.get("cluster_key")
+        self.tracker_cursors = data.get("tracker_cursors") or {}
+
+    @callback
+    def async_schedule_save(
+        self, stats_days: dict[int, dict[str, float]], snapshot: dict[str, Any]
+    ) -> None:
+        """Debounce a write; the store flushes pending writes on shutdown.
+
+        The delay is not restarted by later calls, or refreshes faster than
+        it would postpone the write forever; the data is read when it runs.
+        """
+        self.stats_days = stats_days
+        self.snapshot = snapshot
+        if not self._pending:
+            self._pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a debounced save now; called when the entry unloads."""
+        if self._pending:
+            # Saving cancels the delayed write, so it cannot fire later.
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        self._pending = False
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._pending = False
+        days = sorted(self.stats_days)[-MAX_STORED_DAYS:]
+        snapshot = self.snapshot
+        if snapshot is not None:
+            size = len(json.dumps(snapshot, default=str))
+            if size > MAX_SNAPSHOT_BYTES:
+                _LOGGER.debug("Not persisting %s byte PMG snapshot", size)
+                snapshot = None
+        return {
+            "stats_days": {str(day): self.stats_days[day] for day in days},
+            "snapshot": snapshot,
+            "cluster_key": self.cluster_key,
+            "tracker_cursors": self.tracker_cursors,
+        }
+
+
+@callback
+def async_get_storage(hass: HomeAssistant, entry_id: str) -> PMGStorage:
+    """The store of an entry, kept across reloads so removal cancels its writes."""
+    stores: dict[str, PMGStorage] = hass.data.setdefault(DATA_STORAGE, {})
+    if (storage := stores.get(entry_id)) is None:
+        storage = stores[entry_id] = PMGStorage(hass, entry_id)
+    return storage
@@ -0,0 +1,253 @@
+"""Live mail counters from PMG syslog messages."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import ipaddress
+import logging
+import re
+import socket
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SYSLOG = f"{DOMAIN}_syslog"
+MAX_MESSAGE = 8192  # bytes
+
+_RFC5424 = re.compile(r"1 \S+ \S+ (\S+) \S+ \S+ (?:-|\[.*?\]) ?\ufeff?(.*)", re.S)
+_RFC3164 = re.compile(
+    r"(?:[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d |\d{4}-\d\d-\d\dT\S+ )?"
+    r"(?:\S+ )??([\w./-]+)(?:\[\d+\])?: (.*)",
+    re.S,
+)
+
+_SA_SCORE = re.compile(r": SA score=([\d.]+)/([\d.]+) ")
+_PROCESSING_TIME = re.compile(r": processing time: ([\d.]+) seconds")
+
+# Direction is not visible in these lines, so mail events count as incoming;
+# the next /statistics/mail poll puts outgoing mail where it belongs.
+_FILTER_EVENTS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (": new mail message-id=", ("count", "count_in")),
+    (": virus detected: ", ("viruscount_in",)),
+)
+_POSTFIX_EVENTS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Recipient address rejected: Service is unavailable (try later)", ("glcount",)),
+    ("Rejected by SPF", ("spfcount",)),
+    (" blocked using ", ("rbl_rejects",)),
+    ("PREGREET ", ("pregreet_rejects",)),
+    ("sender non-delivery notification", ("bounces_out",)),
+)
+
+
+def parse_message(message: str) -> dict[str, float]:
+    """Counter deltas for one syslog message; empty if it is not relevant."""
+    if message.startswith("<"):
+        message = message[message.find(">") + 1 :]
+    match = _RFC5424.match(message) or _RFC3164.match(message)
+    if match is None:
+        return {}
+    program, text = match.groups()
+
+    deltas: dict[str, float] = {}
+    if program == "pmg-smtp-filter":
+        for marker, keys in _FILTER_EVENTS:
+            if marker in text:
+                for key in keys:
+                    deltas[key] = 1
+        if (score := _SA_SCORE.search(text)) and float(score[1]) >= float(score[2]):
+            deltas["spamcount_in"] = 1
+        if processing := _PROCESSING_TIME.search(text):
+            deltas["avptime"] = float(processing[1])
+    elif program.startswith("postfix/"):
+        for marker, keys in _POSTFIX_EVENTS:
+            if marker in text:
+                for key in keys:
+                    deltas[key] = 1
+                break
+    return deltas
+
+
+class PMGSyslogFramer:
+    """Splits a TCP syslog stream into messages.
+
+    Handles both octet-counted and newline-terminated framing (RFC 6587).
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> list[bytes]:
+        buffer = self._buffer
+        buffer += data
+        messages: list[bytes] = []
+        while buffer:
+            if buffer[:1].isdigit():
+                space = buffer.find(b" ", 0, 6)
+                if space == -1:
+                    if len(buffer) >= 6:
+                        buffer.clear()  # Not a frame length; resynchronise.
+                    break
+                length = int(buffer[:space])
+                end = space + 1 + length
+                if length > MAX_MESSAGE:
+                    buffer.clear()
+                    break
+                if len(buffer) < end:
+                    break
+                messages.append(bytes(buffer[space + 1 : end]))
+                del buffer[:end]
+            else:
+                newline = buffer.find(b"\n")
+                if newline == -1:
+                    if len(buffer) > MAX_MESSAGE:
+                        buffer.clear()
+                    break
+                messages.append(bytes(buffer[:newline]))
+                del buffer[: newline + 1]
+        return [message.rstrip(b"\r\x00") for message in messages if message.strip()]
+
+
+@dataclass
+class _Subscriber:
+    sources: set[str]
+    callback: Callable[[dict[str, float]], None]
+
+
+class _UDPProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: PMGSyslogServer) -> None:
+        self._server = server
+
+    def datagram_received(self, data: bytes, addr: tuple[Any, ...]) -> None:
+        for message in data.splitlines():
+            self._server.handle(addr[0], message)
+
+
+class _TCPProtocol(asyncio.Protocol):
+    def __init__(self, server: PMGSyslogServer) -> None:
+        self._server = server
+        self._framer = PMGSyslogFramer()
+        self._source = ""
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        peer = transport.get_extra_info("peername")
+        self._source = peer[0] if peer else ""
+
+    def data_received(self, data: bytes) -> None:
+        for message in self._framer.feed(data):
+            self._server.handle(self._source, message)
+
+
+class PMGSyslogServer:
+    """UDP and TCP syslog listener shared by every entry using one port.
+
+    Messages are routed to the entries whose gateway addresses sent them.
+    """
+
+    def __init__(self, port: int) -> None:
+        self.port = port
+        self.received = 0
+        self.matched = 0
+        self.unrouted = 0
+        self._subscribers: list[_Subscriber] = []
+        self._transport: asyncio.DatagramTransport | None = None
+        self._server: asyncio.AbstractServer | None = None
+
+    async def async_start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _UDPProtocol(self), local_addr=("0.0.0.0", self.port)
+        )
+        try:
+            self._server = await loop.create_server(
+                lambda: _TCPProtocol(self), "0.0.0.0", self.port
+            )
+        except OSError:
+            self._transport.close()
+            raise
+
+    async def async_stop(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    @callback
+    def handle(self, source: str, message: bytes) -> None:
+        self.received += 1
+        deltas = parse_message(message[:MAX_MESSAGE].decode("utf-8", "replace"))
+        if not deltas:
+            return
+        self.matched += 1
+        source = source.removeprefix("::ffff:")
+        routed = False
+        for subscriber in self._subscribers:
+            if source in subscriber.sources:
+                subscriber.callback(deltas)
+                routed = True
+        if not routed:
+            self.unrouted += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "port": self.port,
+            "received": self.received,
+            "matched": self.matched,
+            "unrouted": self.unrouted,
+            "subscribers": len(self._subscribers),
+        }
+
+
+async def async_resolve_sources(hosts: list[str]) -> set[str]:
+    """Addresses the gateways send syslog from."""
+    loop = asyncio.get_running_loop()
+    addresses: set[str] = set()
+    for host in hosts:
+        try:
+            addresses.add(str(ipaddress.ip_address(host)))
+            continue
+        except ValueError:
+            pass
+        try:
+            infos = await loop.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+        except OSError as err:
+            _LOGGER.debug("Could not resolve %s for syslog: %s", host, err)
+            continue
+        addresses.update(str(info[4][0]) for info in infos)
+    return addresses
+
+
+async def async_subscribe_syslog(
+    hass: HomeAssistant,
+    port: int,
+    sources: set[str],
+    subscriber_callback: Callable[[dict[str, float]], None],
+) -> tuple[PMGSyslogServer, Callable[[], Any]]:
+    """Start (or join) the listener on a port.
+
+    Messages are passed on if they come from one of the sources, which the
+    caller may extend later; an empty set accepts no sender. Returns the
+    server and an async function that leaves it again; the last subscriber
+    to leave stops the listener.
+    """
+    servers: dict[int, PMGSyslogServer] = hass.data.setdefault(DATA_SYSLOG, {})
+    server = servers.get(port)
+    if server is None:
+        server = PMGSyslogServer(port)
+        await server.async_start()
+        servers[port] = server
+    subscriber = _Subscriber(sources, subscriber_callback)
+    server._subscribers.append(subscriber)
+
+    async def _async_unsubscribe() -> None:
+        server._subscribers.remove(subscriber)
+        if not server._subscribers and servers.get(port) is server:
+            del servers[port]
+            await server.async_stop()
+
+    return server, _async_unsubscribe
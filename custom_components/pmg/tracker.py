@@ -0,0 +1,110 @@
+"""Incremental reading of the PMG message tracker."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# dstatus of a tracker entry: SMTP reply class or a PMG status letter.
+TRACKER_STATUSES: dict[str, str] = {
+    "2": "delivered",
+    "A": "delivered",
+    "4": "deferred",
+    "G": "deferred",
+    "5": "rejected",
+    "N": "rejected",
+    "B": "rejected",
+}
+TRACKER_CATEGORIES = ("delivered", "deferred", "rejected")
+TRACKER_WINDOW = 15  # minutes the rates are averaged over
+TRACKER_LIMIT = 2000  # entries per request
+
+
+class PMGTracker:
+    """Per-minute mail rates from /nodes/{node}/tracker.
+
+    Every node has a cursor, the time of the newest entry read plus the ids
+    seen in that second, so a poll only asks for newer entries. Entries are
+    counted into a ring of per-minute buckets covering the rate window.
+    """
+
+    def __init__(
+        self,
+        cursors: dict[str, dict[str, Any]] | None = None,
+        window: int = TRACKER_WINDOW,
+    ) -> None:
+        self.window = window
+        self.entries_read = 0
+        self._cursors: dict[str, tuple[int, set[str]]] = {
+            node_name: (int(cursor["time"]), set(cursor.get("ids") or ()))
+            for node_name, cursor in (cursors or {}).items()
+            if isinstance(cursor, dict) and cursor.get("time") is not None
+        }
+        self._minutes: list[int] = [-1] * window
+        self._buckets: list[dict[str, int]] = [{} for _ in range(window)]
+
+    @property
+    def cursors(self) -> dict[str, dict[str, Any]]:
+        return {
+            node_name: {"time": time, "ids": sorted(ids)}
+            for node_name, (time, ids) in self._cursors.items()
+        }
+
+    def params(self, node_name: str, now: int) -> dict[str, Any]:
+        """Query for the entries of a node that were not read yet."""
+        start = now - self.window * 60
+        if (cursor := self._cursors.get(node_name)) is not None:
+            # After a long outage the backlog is skipped; it is outside the window.
+            start = max(start, cursor[0])
+        return {"starttime": start, "endtime": now, "limit": TRACKER_LIMIT}
+
+    def ingest(self, node_name: str, entries: Any, now: int) -> int:
+        """Count the new entries of one poll and move the cursor past them."""
+        last_time, last_ids = self._cursors.get(node_name, (0, set()))
+        newest, newest_ids = last_time, set(last_ids)
+        first_minute = now // 60 - self.window + 1
+        added = 0
+        for entry in entries if isinstance(entries, list) else ():
+            if not isinstance(entry, dict) or entry.get("time") is None:
+                continue
+            time = int(entry["time"])
+            entry_id = str(entry.get("id", ""))
+            if time < last_time or (time == last_time and entry_id in last_ids):
+                continue
+            added += 1
+            if time > newest:
+                newest, newest_ids = time, {entry_id}
+            elif time == newest:
+                newest_ids.add(entry_id)
+
+            category = TRACKER_STATUSES.get(str(entry.get("dstatus", "")))
+            minute = time // 60
+            if category is None or not first_minute <= minute <= now // 60:
+                continue
+            slot = minute % self.window
+            if self._minutes[slot] != minute:
+                self._minutes[slot] = minute
+                self._buckets[slot] = {}
+            bucket = self._buckets[slot]
+            bucket[category] = bucket.get(category, 0) + 1
+
+        self.entries_read += added
+        self._cursors[node_name] = (newest, newest_ids)
+        return added
+
+    def rates(self, now: int) -> dict[str, float]:
+        """Entries per minute of each category over the window."""
+        first_minute = now // 60 - self.window + 1
+        totals = dict.fromkeys(TRACKER_CATEGORIES, 0)
+        for minute, bucket in zip(self._minutes, self._buckets):
+            if minute >= first_minute:
+                for category, count in bucket.items():
+                    totals[category] += count
+        return {
+            category: round(count / self.window, 2)
+            for category, count in totals.items()
+        }
+
+    def prune(self, node_names: list[str]) -> None:
+        """Forget the cursors of nodes that left the cluster."""
+        for node_name in set(self._cursors) - set(node_names):
+            del self._cursors[node_name]